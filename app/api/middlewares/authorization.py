@@ -9,7 +9,7 @@ from app.api.middlewares.jwt_bearer import (
     bearer_scheme,
 )
 from app.api.models.account_models import Account
-from app.api.models.organization_models import OrganizationMember
+from app.api.models.organization_models import Organization, OrganizationMember
 from app.api.responses.custom_responses import CustomException
 from app.api.schemas.account_schemas import AccountAuthorized
 from app.api.schemas.organization_schemas import AuthorizeOrganizationSchema
@@ -112,8 +112,20 @@ def is_org_authorized(
         ) from e
 
     emxsidqw = decode_data(emxsidqw)
+    # only the columns needed for the authorization payload, so the
+    # member's eager-loaded relationships are not joined on every request
     member_instance = (
-        db.query(OrganizationMember)
+        db.query(
+            OrganizationMember.id,
+            OrganizationMember.account_id,
+            OrganizationMember.organization_id,
+            OrganizationMember.organization_role_id,
+            Organization.name,
+        )
+        .join(
+            Organization,
+            Organization.id == OrganizationMember.organization_id,
+        )
         .filter(
             OrganizationMember.account_id == auth.account.id,
             OrganizationMember.organization_id == emxsidqw,
@@ -127,7 +139,7 @@ def is_org_authorized(
         )
     auth.member = AuthorizeOrganizationSchema(
         id=member_instance.id,
-        name=member_instance.organization.name,
+        name=member_instance.name,
         account_id=member_instance.account_id,
         organization_id=member_instance.organization_id,
         role_id=member_instance.organization_role_id,
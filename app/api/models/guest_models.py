@@ -2,7 +2,19 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    event,
+)
 from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import relationship
 
@@ -21,6 +33,7 @@ class Guest(Base):
     first_name (str): The first name of the guest.
     last_name (str): The last name of the guest.
     email (str): The email of the guest.
+    email_lower (str): The lowercased email, generated by the database.
     phone_number (str): The phone number of the guest.
     organization_id (str): The id of the organization.
     rsvp_status (str): The status of the guest's RSVP.
@@ -42,10 +55,45 @@ class Guest(Base):
   """
 
     __tablename__ = "guest"
+    # trigram indexes back the substring ilike searches on postgresql and
+    # the pattern index backs the prefix email search, the composite index
+    # backs the keyset pagination of guest lists
+    __table_args__ = (
+        Index(
+            "ix_guest_organization_id_created_at_id",
+            "organization_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_guest_email_lower_pattern",
+            "email_lower",
+            postgresql_ops={"email_lower": "varchar_pattern_ops"},
+        ),
+        Index(
+            "ix_guest_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_guest_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_guest_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
+    )
     id = Column(String, primary_key=True, default=uuid4().hex)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False, default="")
-    email = Column(String, nullable=False)
+    email = Column(String, nullable=False, unique=True)
+    email_lower = Column(String, Computed("lower(email)", persisted=True))
     phone_number = Column(String, default="")
     location = Column(String, default="")
 
@@ -85,6 +133,17 @@ class Guest(Base):
     meal = relationship("Meal", backref="guests", lazy="joined")
 
 
+# gin_trgm_ops is provided by the pg_trgm extension, which has to exist
+# before the trigram indexes on the guest table are created
+event.listen(
+    Guest.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(
+        dialect="postgresql"
+    ),
+)
+
+
 class GuestTags(Base):
     """
   Guest Tags Model:
@@ -103,6 +162,9 @@ class GuestTags(Base):
   """
 
     __tablename__ = "guest_tags"
+    # a guest has a tag at most once; the unique index also backs the
+    # lookup of a guest's existing tags
+    __table_args__ = (UniqueConstraint("guest_id", "tag_id"),)
 
     id = Column(String, primary_key=True, default=uuid4().hex)
     guest_id = Column(
@@ -2,7 +2,16 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from app.database.connection import Base
@@ -34,7 +43,16 @@ class MealCategory(Base):  # type: ignore
     """
 
     __tablename__ = "meal_category"
-    id = Column(String, primary_key=True, default=uuid4().hex)
+    # rejects duplicate names within an organization, its index also backs
+    # the category listing of an organization
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "name",
+            name="uq_meal_category_organization_id_name",
+        ),
+    )
+    id = Column(String, primary_key=True, default=lambda: uuid4().hex)
     name = Column(String, nullable=False)
     organization_id = Column(
         String,
@@ -83,7 +101,25 @@ class Meal(Base):  # type: ignore
     """
 
     __tablename__ = "meal"
-    id = Column(String, primary_key=True, default=uuid4().hex)
+    # back the meal listings of an organization and of a category, both
+    # filtered on is_hidden and paged in (created_at, id) order
+    __table_args__ = (
+        Index(
+            "ix_meal_organization_id_is_hidden_created_at_id",
+            "organization_id",
+            "is_hidden",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_meal_meal_category_id_is_hidden_created_at_id",
+            "meal_category_id",
+            "is_hidden",
+            "created_at",
+            "id",
+        ),
+    )
+    id = Column(String, primary_key=True, default=lambda: uuid4().hex)
     name = Column(String, nullable=False)
 
     description = Column(
@@ -136,7 +172,16 @@ class MealTag(Base):  # type: ignore
     """
 
     __tablename__ = "meal_tag"
-    id = Column(String, primary_key=True, default=uuid4().hex)
+    # a tag is added to a meal only once, meal_id leads so the index of
+    # the constraint also backs the tag listing of a meal
+    __table_args__ = (
+        UniqueConstraint(
+            "meal_id",
+            "organization_tag_id",
+            name="uq_meal_tag_meal_id_organization_tag_id",
+        ),
+    )
+    id = Column(String, primary_key=True, default=lambda: uuid4().hex)
     organization_tag_id = Column(
         String,
         ForeignKey("organization_tag.id", ondelete="CASCADE"),
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -87,6 +88,8 @@ class Organization(Base):  # type: ignore
     """
 
     __tablename__ = "organization"
+    # back the duplicate name check of an owner on create
+    __table_args__ = (Index("ix_organization_owner_name", "owner", "name"),)
     id = Column(String, primary_key=True, default=uuid4().hex)
     name = Column(String, nullable=False)
     owner = Column(
@@ -108,8 +111,16 @@ class Organization(Base):  # type: ignore
         lazy="joined",
         cascade="all,delete",
     )
+    # children whose foreign keys cascade on delete are passive and left
+    # to the database. Budget, tags and track_email have rows pointing at
+    # them without a cascade. Meal categories cascade to meals that
+    # guests point at without a cascade. Members and invites must be gone
+    # before the owner account is deleted. So the ORM still deletes those.
     gifts = relationship(
-        "Gift", back_populates="organization", cascade="all,delete"
+        "Gift",
+        back_populates="organization",
+        cascade="all,delete",
+        passive_deletes=True,
     )
     detail = relationship(
         "OrganizationDetail",
@@ -117,6 +128,7 @@ class Organization(Base):  # type: ignore
         lazy="joined",
         cascade="all,delete",
         uselist=False,
+        passive_deletes=True,
     )
     organization_members = relationship(
         "OrganizationMember",
@@ -133,10 +145,16 @@ class Organization(Base):  # type: ignore
         "OrganizationTag", back_populates="organization", cascade="all,delete"
     )
     organization_roles = relationship(
-        "OrganizationRole", back_populates="organization", cascade="all,delete"
+        "OrganizationRole",
+        back_populates="organization",
+        cascade="all,delete",
+        passive_deletes=True,
     )
     checklist = relationship(
-        "Checklist", back_populates="organization", cascade="all,delete"
+        "Checklist",
+        back_populates="organization",
+        cascade="all,delete",
+        passive_deletes=True,
     )
 
     bank_details = relationship(
@@ -144,18 +162,21 @@ class Organization(Base):  # type: ignore
         back_populates="organization",
         lazy="joined",
         cascade="all,delete",
+        passive_deletes=True,
     )
     link_details = relationship(
         "LinkDetail",
         back_populates="organization",
         lazy="joined",
         cascade="all,delete",
+        passive_deletes=True,
     )
     wallet_details = relationship(
         "WalletDetail",
         back_populates="organization",
         lazy="joined",
         cascade="all,delete",
+        passive_deletes=True,
     )
     track_email = relationship(
         "TrackEmail", back_populates="organization", cascade="all,delete"
@@ -249,10 +270,8 @@ class OrganizationMember(Base):  # type: ignore
       account_id: This is the foreign key of the account table.
       organization_role_id: This is the foreign key of the \
         organization_role table.
-      invite_token: This is the token which is used to invite the \
-        organization member.
-      is_accepted: This is the boolean value which tells whether the \
-        member is accepted or not.
+      invite_id: This is the foreign key of the invite_member table, \
+        the invite token and its acceptance are stored there.
       is_suspended: This is the boolean value which tells whether the \
         member is suspended or not.
       created_at: This is the date and time when the organization \
@@ -270,6 +289,15 @@ class OrganizationMember(Base):  # type: ignore
     """
 
     __tablename__ = "organization_member"
+    # back the member lookups of an account in an organization, the
+    # organization_id prefix also serves the member listings
+    __table_args__ = (
+        Index(
+            "ix_organization_member_organization_id_account_id",
+            "organization_id",
+            "account_id",
+        ),
+    )
     id = Column(String, primary_key=True, default=uuid4().hex)
     organization_id = Column(
         String,
@@ -335,7 +363,8 @@ class InviteMember(Base):  # type: ignore
       organization_id: This is the foreign key of the organization table.
       account_id: This is the foreign key of the account table.
       invite_token: This is the token which is used to invite the \
-        organization member.
+        organization member, it has a unique index as accepting an \
+        invite looks it up by token alone.
       status: This is the status of the invite.
       is_accepted: This is the boolean value which tells whether the \
         member is accepted or not.
@@ -349,6 +378,14 @@ class InviteMember(Base):  # type: ignore
     """
 
     __tablename__ = "invite_member"
+    # back the invite lookups of an account in an organization
+    __table_args__ = (
+        Index(
+            "ix_invite_member_organization_id_account_id",
+            "organization_id",
+            "account_id",
+        ),
+    )
     id = Column(String, primary_key=True, default=uuid4().hex)
     organization_id = Column(
         String,
@@ -358,7 +395,7 @@ class InviteMember(Base):  # type: ignore
     account_id = Column(
         String, ForeignKey("account.id", ondelete="CASCADE"), nullable=False
     )
-    invite_token = Column(String, nullable=False)
+    invite_token = Column(String, nullable=False, unique=True, index=True)
     status = Column(INVITE_STATUS, default="pending")
     is_accepted = Column(Boolean, default=False)
     sent_invite_date = Column(DateTime)
@@ -468,7 +505,15 @@ class OrganizationTag(Base):  # type: ignore
     """
 
     __tablename__ = "organization_tag"
-    id = Column(String, primary_key=True, default=uuid4().hex)
+    # backs the lookups of a tag by name within an organization
+    __table_args__ = (
+        Index(
+            "ix_organization_tag_organization_id_name",
+            "organization_id",
+            "name",
+        ),
+    )
+    id = Column(String, primary_key=True, default=lambda: uuid4().hex)
     organization_id = Column(
         String,
         ForeignKey("organization.id", ondelete="CASCADE"),
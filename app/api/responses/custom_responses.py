@@ -9,7 +9,9 @@ response: dict
 
 from typing import Any, Optional
 
+import orjson
 from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
 
 
@@ -99,6 +101,25 @@ class CustomResponse(JSONResponse):  # type: ignore
             **kwargs
         )
 
+    def render(self, content: Any) -> bytes:
+        """Render the content with orjson.
+
+        Datetimes, uuids and enums are serialized natively, so services can
+        hand over plain dicts of column values. Anything orjson does not
+        know, such as pydantic models, falls back to `jsonable_encoder`.
+
+        Args:
+          content (Any): The content to be rendered
+
+        Returns:
+          bytes: The rendered content
+        """
+        return orjson.dumps(
+            content,
+            default=jsonable_encoder,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
 
 class CustomException(HTTPException):  # type: ignore
     """Custom exception class.
@@ -36,12 +36,13 @@ async def get_organization_user_dashboard(
     )
 
     get_org_user_dash(organization_id, db)
+    account = auth.account
     return {
         "message": "Dashboard data retrieved successfully",
         "data": {
-            "account_id": auth.account.id,
-            "account_email": auth.account.email,
-            "account_first_name": auth.account.first_name,
-            "account_last_name": auth.account.last_name,
+            "account_id": account.id,
+            "account_email": account.email,
+            "account_first_name": account.first_name,
+            "account_last_name": account.last_name,
         },
     }
@@ -42,7 +42,7 @@ async def upload_file(
     Returns:
         url (str): The url of the uploaded file.
     """
-    return upload_file_to_cloudinary(
+    return await upload_file_to_cloudinary(
         file=file, organization_id=auth.member.organization_id, db=db
     )
 
@@ -1,6 +1,7 @@
 """This module defines the FastAPI API endpoints for meal management."""
 
 
+from datetime import datetime
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends
@@ -27,9 +28,10 @@ from app.services.meal_services import (
     fetch_meal_category_by_id,
     fetch_meal_tag_by_id,
     get_all_meal_tag_service,
+    get_meal_categories,
+    get_meal_service,
+    hide_meal_service,
 )
-from app.services.meal_services import get_meal_categories as get_all
-from app.services.meal_services import get_meal_service, hide_meal_service
 
 BASE_URL = "/meal-management"
 
@@ -91,18 +93,15 @@ def get_all_meal_category(
         CustomResponse: Custom response containing the list of all meal
         categories associated with the organization.
 
-    Response (Success - 201):
+    Response (Success - 200):
         JSON response containing the list of all meal categories:
         - Each item represents a meal category object with the details:
             - id (str): The unique identifier of the meal category.
             - name (str): The name or title of the meal category.
-            - organization_id (str): The UUID of the associated organization.
-            - organization (dict): Details of the associated organization,
-                including its name and ID.
-            - meals (List[Meal]): The list of meals associated with category.
+            - created at (str): When the meal category was created.
     """
     try:
-        category_list = get_all(org_id=auth.member.organization_id, db=db)
+        category_list = get_meal_categories(auth.member.organization_id, db=db)
 
     except Exception as e:
         raise e
@@ -147,7 +146,7 @@ def get_meal_category_by_id(
     return CustomResponse(
         status_code=200,
         message="Meal Category Successfully fetched",
-        data=jsonable_encoder(category),
+        data=jsonable_encoder(category, exclude={"organization"}),
     )
 
 
@@ -241,25 +240,34 @@ def get_all_meals(
     offset: int = 0,
     meal_category_id: Optional[str] = None,
     ishidden: Optional[bool] = False,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[str] = None,
+    include_tags: bool = False,
     auth: Authorize = Depends(is_org_authorized),
     db: Session = Depends(get_db),
 ) -> CustomResponse:
-    """This is the meal endpoint to get al meal."""
+    """This is the meal endpoint to get al meal.
+
+    Pass the after_created_at and after_id of the next_cursor to fetch the
+    next page, the offset is only used when no cursor is given. Set
+    include_tags to add the tags of each meal on the page.
+    """
 
     return CustomResponse(
         status_code=200,
         message="Meals retrieved successfully.",
-        data=jsonable_encoder(
-            get_meal_service(
-                offset=offset,
-                limit=limit,
-                order=order,
-                db=db,
-                sort_by=sort_by,
-                meal_category_id=meal_category_id,
-                ishidden=ishidden,
-                organization_id=auth.member.organization_id,
-            )
+        data=get_meal_service(
+            offset=offset,
+            limit=limit,
+            order=order,
+            db=db,
+            sort_by=sort_by,
+            meal_category_id=meal_category_id,
+            ishidden=ishidden,
+            organization_id=auth.member.organization_id,
+            after_created_at=after_created_at,
+            after_id=after_id,
+            include_tags=include_tags,
         ),
     )
 
@@ -401,7 +409,7 @@ def add_meal_tag(
     return CustomResponse(
         status_code=201,
         message="Meal Tag Successfully Added",
-        data=jsonable_encoder(new_meal_tag),
+        data=new_meal_tag,
     )
 
 
@@ -418,7 +426,7 @@ def get_all_meal_tag(
     return CustomResponse(
         status_code=200,
         message="All Meal tag retrieved successfully.",
-        data=jsonable_encoder(get_all_meal_tag_service(meal_id, db=db)),
+        data=get_all_meal_tag_service(meal_id, db=db),
     )
 
 
@@ -1,5 +1,7 @@
 """Organization Guest Router."""
 
+from datetime import datetime
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
@@ -9,10 +11,12 @@ from app.api.schemas.guest_schemas import AddGuest, UpdateGuest
 from app.database.connection import get_db
 from app.services.guest_services import (
     add_guest,
+    bulk_add_guests,
     fetch_all_guests,
     search_organization_guests,
     update_organization_guest,
 )
+from app.services.queue_services import TaskQueue, get_task_queue
 
 router = APIRouter(
     prefix="/guests",
@@ -24,6 +28,8 @@ router = APIRouter(
 def get_guests(
     auth: Authorize = Depends(is_org_authorized),
     db: Session = Depends(get_db),
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
 ):
@@ -33,14 +39,21 @@ def get_guests(
 
     Args:
         db: This is the SQLAlchemy Session object.
-        skip: This is the number of guests to skip.
+        after_created_at: This is the created_at of the next_cursor.
+        after_id: This is the id of the next_cursor.
+        skip: This is the number of guests to skip (deprecated).
         limit: This is the number of guests to limit.
 
     Returns:
-        List[Guest]: This is the list of guests.
+        List[Guest]: This is the list of guests and the next_cursor.
     """
     return fetch_all_guests(
-        db, auth.member.organization_id, kwargs={"skip": skip, "limit": limit}
+        db,
+        auth.member.organization_id,
+        after_created_at=after_created_at,
+        after_id=after_id,
+        skip=skip,
+        limit=limit,
     )
 
 
@@ -49,6 +62,7 @@ def create_guest(
     guest: AddGuest,
     auth: Authorize = Depends(is_org_authorized),
     db: Session = Depends(get_db),
+    task_queue: TaskQueue = Depends(get_task_queue),
 ):
     """
     create_guest:
@@ -60,7 +74,28 @@ def create_guest(
     Returns:
         Guest: This is the guest that was created.
     """
-    return add_guest(guest, auth.member.organization_id, db)
+    return add_guest(guest, auth.member.organization_id, db, task_queue)
+
+
+@router.post("/bulk-create")
+def bulk_create_guests(
+    guests: List[AddGuest],
+    auth: Authorize = Depends(is_org_authorized),
+    db: Session = Depends(get_db),
+    task_queue: TaskQueue = Depends(get_task_queue),
+):
+    """
+    bulk_create_guests:
+        This method is used to create many guests at once.
+
+    Args:
+        guests: This is the list of guests to create.
+        db: This is the SQLAlchemy Session object.
+
+    Returns:
+        Dict: This is the number of guests created and the skipped emails.
+    """
+    return bulk_add_guests(guests, auth.member.organization_id, db, task_queue)
 
 
 @router.get("/search")
@@ -69,6 +104,8 @@ def search_guests(
     name: str = "",
     auth: Authorize = Depends(is_org_authorized),
     db: Session = Depends(get_db),
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[str] = None,
     skip: int = 0,
     limit: int = 100,
 ):
@@ -78,18 +115,23 @@ def search_guests(
 
     Args:
         db: This is the SQLAlchemy Session object.
-        skip: This is the number of guests to skip.
+        after_created_at: This is the created_at of the next_cursor.
+        after_id: This is the id of the next_cursor.
+        skip: This is the number of guests to skip (deprecated).
         limit: This is the number of guests to limit.
 
     Returns:
-        List[Guest]: This is the list of guests.
+        List[Guest]: This is the list of guests and the next_cursor.
     """
     return search_organization_guests(
         db,
         auth.member.organization_id,
         email,
         name,
-        kwargs={"skip": skip, "limit": limit},
+        after_created_at=after_created_at,
+        after_id=after_id,
+        skip=skip,
+        limit=limit,
     )
 
 
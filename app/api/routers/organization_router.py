@@ -31,7 +31,7 @@ router = APIRouter(prefix="/organization", tags=["Organization"])
 
 
 @router.post("")
-async def create_user_organization(
+def create_user_organization(
     req: OrganizationCreate,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
@@ -93,7 +93,7 @@ async def create_user_organization(
     ```
     """
     try:
-        organization_details = await create_organization(
+        organization_details = create_organization(
             db, auth.account.id, req, background_tasks
         )
     except Exception as e:
@@ -106,7 +106,7 @@ async def create_user_organization(
 
 
 @router.get("/all")
-async def get_all_user_organizations(
+def get_all_user_organizations(
     db: Session = Depends(get_db),  # pylint: disable=unused-argument
     auth: Authorize = Depends(  # pylint: disable=unused-argument
         is_authenticated
@@ -173,7 +173,7 @@ async def get_all_user_organizations(
 
 
 @router.get("")
-async def get_user_organization(
+def get_user_organization(
     db: Session = Depends(get_db),  # pylint: disable=unused-argument
     auth: Authorize = Depends(  # pylint: disable=unused-argument
         is_org_authorized
@@ -242,7 +242,7 @@ async def get_user_organization(
 
 
 @router.put("")
-async def update_user_organization(
+def update_user_organization(
     req: OrganizationUpdate,
     db: Session = Depends(get_db),
     auth: Authorize = Depends(is_authenticated),
@@ -316,7 +316,7 @@ async def update_user_organization(
 
 
 @router.delete("")
-async def delete_user_organization(
+def delete_user_organization(
     background_tasks: BackgroundTasks,
     auth: Authorize = Depends(is_org_authorized),
     db: Session = Depends(get_db),
@@ -384,7 +384,7 @@ async def delete_user_organization(
 
 
 @router.post("/invite")
-async def invite_new_member(
+def invite_new_member(
     invite: InviteMemberSchema,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
@@ -462,7 +462,7 @@ async def invite_new_member(
 
 
 @router.get("/members")
-async def get_organization_members(
+def get_organization_members(
     db: Session = Depends(get_db),
     auth: Authorize = Depends(is_org_authorized),
 ) -> CustomResponse:
@@ -520,7 +520,7 @@ async def get_organization_members(
     ```
     """
     try:
-        invites = await get_members(db, auth.member.organization_id)
+        invites = get_members(db, auth.member.organization_id)
     except Exception as e:
         raise e
     return CustomResponse(
@@ -532,7 +532,7 @@ async def get_organization_members(
 
 # An endpoint to accept an invite
 @router.get("/invite/accept/{invite_token}")
-async def accept_invitation(
+def accept_invitation(
     invite_token: str,
     db: Session = Depends(get_db),
 ) -> CustomResponse:
@@ -597,7 +597,7 @@ async def accept_invitation(
 
 
 @router.get("/invite/{email}")
-async def resend_invitation(
+def resend_invitation(
     email: str,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
@@ -669,7 +669,7 @@ async def resend_invitation(
 
 
 @router.patch("/{member_id}")
-async def suspend_unsuspend_membership(
+def suspend_unsuspend_membership(
     member_id: str,
     background_tasks: BackgroundTasks,
     auth: Authorize = Depends(is_org_authorized),
@@ -83,10 +83,10 @@ class GuestResponse(BaseModel):
       rsvp_status (str): The rsvp status of the guest.
       has_plus_one (bool): The has plus one status of the guest.
       is_plus_one (bool): The is plus one status of the guest.
-      plus_one (GuestPlusOne): The plus one of the guest.
+      plus_one (GuestPlusOne): The plus one of the guest, if any.
       tag_ids (List[GuestTagsSchema]): The tag ids of the guest.
       table (GuestAssignedTable): The assigned table of the guest.
-      meal (GuestMeal): The meal of the guest.
+      meal (GuestMeal): The meal of the guest, if any.
     """
 
     id: str
@@ -99,10 +99,10 @@ class GuestResponse(BaseModel):
     rsvp_status: str
     has_plus_one: bool
     is_plus_one: bool
-    plus_one: GuestPlusOne
+    plus_one: Optional[GuestPlusOne] = None
     tag_ids: List[GuestTagsSchema]
     table: GuestAssignedTable
-    meal: GuestMeal
+    meal: Optional[GuestMeal] = None
 
 
 class AddGuest(GuestPlusOne):
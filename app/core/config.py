@@ -34,6 +34,11 @@ class Settings:
     DB_PASSWORD = config("DB_PASSWORD", default="root")
     DB_HOST = config("DB_HOST", default="localhost")
     DB_PORT = config("DB_PORT", default="5432")
+    DB_POOL_SIZE = config("DB_POOL_SIZE", default=20, cast=int)
+    DB_MAX_OVERFLOW = config("DB_MAX_OVERFLOW", default=40, cast=int)
+    DB_POOL_RECYCLE = config("DB_POOL_RECYCLE", default=1800, cast=int)
+    DB_POOL_TIMEOUT = config("DB_POOL_TIMEOUT", default=30, cast=int)
+    DB_QUERY_CACHE_SIZE = config("DB_QUERY_CACHE_SIZE", default=1200, cast=int)
 
     ENVIRONMENT = config("ENVIRONMENT", default="")
     AUTH_SECRET_KEY = config("AUTH_SECRET_KEY", cast=str)
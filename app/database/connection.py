@@ -32,12 +32,28 @@ def get_db_engine() -> Engine:
             f"postgresql://{db_user}:{db_password}"
             f"@{db_host}:{db_port}/{db_name}"
         )
-        return create_engine(database_url)
+        return create_engine(
+            database_url,
+            # The pool is sized for the threadpool that serves sync routes.
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            # Connections are replaced before the server drops them.
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            # A request waits at most this long for a free connection.
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            # Connections closed while idle are detected before use.
+            pool_pre_ping=True,
+            # The statement cache holds every query the services build.
+            # Queries only reuse an entry when values are bound as params.
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        )
 
     if db_type == "sqlite":
         database_url = "sqlite:///./database.db"
         return create_engine(
-            database_url, connect_args={"check_same_thread": False}
+            database_url,
+            connect_args={"check_same_thread": False},
+            query_cache_size=settings.DB_QUERY_CACHE_SIZE,
         )
 
     raise ValueError("Database type not supported")
@@ -45,7 +61,11 @@ def get_db_engine() -> Engine:
 
 db_engine = get_db_engine()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+# keep instances loaded after commit so callers can serialize what they
+# just wrote without a refresh round-trip
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=db_engine
+)
 
 Base = declarative_base()
 
@@ -50,7 +50,6 @@ def create_checklist(
 
     db.add(checklist_data)
     db.commit()
-    db.refresh(checklist_data)
 
     return ChecklistResponse(
         id=checklist_data.id,
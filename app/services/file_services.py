@@ -9,6 +9,7 @@ import cloudinary
 import cloudinary.api
 import cloudinary.uploader
 from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.exc import DataError
 from sqlalchemy.orm import Session
 
@@ -16,7 +17,7 @@ from app.api.models.file_models import File, FileImports
 from app.api.responses.custom_responses import CustomException, CustomResponse
 from app.core.config import settings
 from app.services.custom_services import generate_rows
-from app.services.organization_services import check_organization_exists
+from app.services.organization_services import organization_exists
 
 cloudinary.config(
     cloud_name=settings.CLOUDINARY_CLOUD_NAME,
@@ -29,11 +30,15 @@ cloudinary.config(
 IMPORT_FOLDER = os.path.join(os.path.abspath(settings.IMPORT_DIR))
 
 
-def upload_file_to_cloudinary(
+async def upload_file_to_cloudinary(
     file: UploadFile, organization_id: str, db: Session
 ) -> CustomResponse:
     """Upload a file to cloudinary.
 
+    The organization is checked first and the database connection is handed
+    back to the pool before the upload, which runs in the threadpool so the
+    event loop keeps serving other requests while it waits on cloudinary.
+
     Args:
         file (UploadFile): The file to be uploaded.
         organization_id (str): The id of the organization.
@@ -59,16 +64,21 @@ def upload_file_to_cloudinary(
         @app.post("/upload")
         async def upload_file(organization_id:str, file: UploadFile =\
               File(...), db: Session = Depends(get_db)) -> CustomResponse:
-            return upload_file_to_cloudinary(file=file, \
+            return await upload_file_to_cloudinary(file=file, \
                 organization_id="organization_id", db=db)
         ```
     """
 
-    if check_organization_exists(db, organization_id=organization_id) is None:
+    if not organization_exists(db, organization_id):
         raise CustomException(
             status_code=404, message="Organization not found"
         )
-    result: Dict[str, Any] = cloudinary.uploader.upload(
+
+    # Release the connection so it is not held across the upload
+    db.close()
+
+    result: Dict[str, Any] = await run_in_threadpool(
+        cloudinary.uploader.upload,
         file.file,
         folder=organization_id,
         resource_type="auto",
@@ -21,6 +21,9 @@ from app.api.schemas.gift_schemas import (
     FilterGiftSchema,
 )
 
+# fields left out of every serialized gift
+_EXCLUDE = frozenset({"organization"})
+
 
 def add_product_gift_(
     gift_item: AddProductGift,
@@ -40,17 +43,18 @@ def add_product_gift_(
     gift_item = gift_item.model_dump()
     gift_item["organization_id"] = organization_id
 
-    new_gift = Gift(**gift_item, id=uuid4().hex)
+    # a product gift has no payment options, seed the collection so it is
+    # serialized without a lazy load after commit
+    new_gift = Gift(**gift_item, id=uuid4().hex, payment_options=[])
 
     try:
         db.add(new_gift)
         db.commit()
-        db.refresh(new_gift)
 
         response = CustomResponse(
             status_code=status.HTTP_201_CREATED,
             message="Gift successfully added",
-            data=jsonable_encoder(new_gift, exclude=["organization"]),
+            data=jsonable_encoder(new_gift, exclude=_EXCLUDE),
         )
         return response, None
 
@@ -78,7 +82,7 @@ def edit_product_gift_(
         List: [None,Exception] or [Respoonse,None]. return an exception
         or a CustomResponse
     """
-    gift_instance = db.query(Gift).filter(Gift.id == gift_id).first()
+    gift_instance = db.get(Gift, gift_id)
 
     if not gift_instance:
         exception = CustomException(
@@ -97,7 +101,7 @@ def edit_product_gift_(
         response = CustomResponse(
             status_code=status.HTTP_201_CREATED,
             message="Gift successfully updated",
-            data=jsonable_encoder(gift_instance, exclude=["organization"]),
+            data=jsonable_encoder(gift_instance, exclude=_EXCLUDE),
         )
         return response, None
 
@@ -121,7 +125,7 @@ def fetch_gift(gift_id: str, db: Session) -> tuple[Any, Any]:
         List: [None,Exception] or [Respoonse,None]. return an exception
         or a CustomResponse containing gift data.
     """
-    gift_instance = db.query(Gift).filter(Gift.id == gift_id).first()
+    gift_instance = db.get(Gift, gift_id)
 
     if not gift_instance:
         exception = CustomException(
@@ -138,7 +142,7 @@ def fetch_gift(gift_id: str, db: Session) -> tuple[Any, Any]:
     response = CustomResponse(
         status_code=status.HTTP_200_OK,
         message="success",
-        data=jsonable_encoder(gift_instance, exclude=["organization"]),
+        data=jsonable_encoder(gift_instance, exclude=_EXCLUDE),
     )
     return response, None
 
@@ -153,7 +157,7 @@ def delete_a_gift(gift_id: str, db: Session) -> tuple[Any, Any]:
         List: [None,Exception] or [Respoonse,None]. return an exception
         or a CustomResponse containing gift data.
     """
-    gift_instance = db.query(Gift).filter(Gift.id == gift_id).first()
+    gift_instance = db.get(Gift, gift_id)
 
     if not gift_instance:
         exception = CustomException(
@@ -273,7 +277,7 @@ def gifts_filter(
     response = CustomResponse(
         status_code=status.HTTP_200_OK,
         message="Gifts retrieved successfully",
-        data=jsonable_encoder(gifts, exclude=["organization"]),
+        data=jsonable_encoder(gifts, exclude=_EXCLUDE),
     )
     return response, None
 
@@ -319,7 +323,7 @@ def add_cash_gift(
         return CustomResponse(
             status_code=status.HTTP_201_CREATED,
             message="Gift successfully added",
-            data=jsonable_encoder(new_gift, exclude=["organization"]),
+            data=jsonable_encoder(new_gift, exclude=_EXCLUDE),
         )
     except Exception as exc:
         db.rollback()
@@ -346,7 +350,7 @@ def edit_cash_gift(
         return a CustomResponse
     """
     # Check if gift exists
-    gift_instance = db.query(Gift).filter(Gift.id == gift_id).first()
+    gift_instance = db.get(Gift, gift_id)
     if not gift_instance:
         raise CustomException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -393,7 +397,7 @@ def edit_cash_gift(
         return CustomResponse(
             status_code=status.HTTP_201_CREATED,
             message="Gift successfully Updated",
-            data=jsonable_encoder(gift_instance, exclude=["organization"]),
+            data=jsonable_encoder(gift_instance, exclude=_EXCLUDE),
         )
     except Exception as exc:
         db.rollback()
@@ -1,16 +1,17 @@
 """This module contains the services for the guest model."""
 
+import re
 import secrets
 import string
-import uuid
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, or_, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query, Session, lazyload, load_only, selectinload
 
 from app.api.models.guest_models import Guest, GuestTags
-from app.api.models.organization_models import OrganizationTag
+from app.api.models.organization_models import Organization, OrganizationTag
 from app.api.responses.custom_responses import CustomException, CustomResponse
 from app.api.schemas.guest_schemas import (
     AddGuest,
@@ -21,12 +22,111 @@ from app.api.schemas.guest_schemas import (
     GuestTagsSchema,
     UpdateGuest,
 )
+from app.services.queue_services import TaskQueue
+
+# the hex forms uuid.UUID accepts for tag ids, with or without hyphens
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?"
+    r"[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}"
+)
+
+# plain columns update_organization_guest copies from UpdateGuest
+_GUEST_UPDATE_FIELDS = ("first_name", "last_name", "phone_number", "location")
+
+# invite codes are alphanumeric, drawn from the os csprng
+_INVITE_ALPHABET = string.ascii_letters + string.digits
+_SYSTEM_RANDOM = secrets.SystemRandom()
+
+# rows per executemany batch in bulk_add_guests
+_BULK_CHUNK_SIZE = 1000
+
+# how PostgreSQL and SQLite name the unique constraint on guest.email
+_GUEST_EMAIL_CONSTRAINTS = ("guest_email_key", "guest.email")
+
+# only the columns rendered by GuestResponse (plus the keys used for
+# loading and paging) are selected; relationships it renders are loaded
+# with one extra query per path instead of one per guest, organization
+# and group are not rendered
+_GUEST_RESPONSE_OPTIONS = (
+    load_only(
+        Guest.id,
+        Guest.first_name,
+        Guest.last_name,
+        Guest.email,
+        Guest.invite_code,
+        Guest.phone_number,
+        Guest.location,
+        Guest.rsvp_status,
+        Guest.has_plus_one,
+        Guest.is_plus_one,
+        Guest.plus_one_id,
+        Guest.table_group,
+        Guest.table_number,
+        Guest.seat_number,
+        Guest.meal_id,
+        Guest.created_at,
+    ),
+    selectinload(Guest.plus_one),
+    selectinload(Guest.meal),
+    selectinload(Guest.guest_tags).selectinload(GuestTags.organization_tag),
+    lazyload(Guest.organization),
+    lazyload(Guest.group),
+)
+
+
+def build_guest_response(guest: Guest) -> Dict[str, Any]:
+    """Builds the response payload of a guest.
+
+    Args:
+        guest (Guest): Guest to serialize
+
+    Returns:
+        Dict[str, Any]: Guest serialized as a GuestResponse
+    """
+    return GuestResponse(
+        id=guest.id,
+        first_name=guest.first_name,
+        last_name=guest.last_name,
+        email=guest.email,
+        invite_code=guest.invite_code,
+        phone_number=guest.phone_number,
+        location=guest.location,
+        rsvp_status=guest.rsvp_status,
+        has_plus_one=guest.has_plus_one,
+        is_plus_one=guest.is_plus_one,
+        plus_one=GuestPlusOne(
+            first_name=guest.plus_one.first_name,
+            last_name=guest.plus_one.last_name,
+            email=guest.plus_one.email,
+        )
+        if guest.plus_one
+        else None,
+        meal=GuestMeal(
+            id=guest.meal.id,
+            name=guest.meal.name,
+        )
+        if guest.meal
+        else None,
+        table=GuestAssignedTable(
+            table_group_id=guest.table_group,
+            table_number=guest.table_number,
+            seat_number=guest.seat_number,
+        ),
+        tag_ids=[
+            GuestTagsSchema(
+                id=tag.tag_id,
+                name=tag.organization_tag.name,
+            )
+            for tag in guest.guest_tags
+        ],
+    ).model_dump(mode="python", exclude_none=True)
 
 
 def add_guest(
     guest: AddGuest,
     organization_id: str,
     db: Session,
+    task_queue: TaskQueue,
     rsvp_status: str = "pending",
 ) -> Guest:
     """Creates a guest.
@@ -35,17 +135,14 @@ def add_guest(
         guest (AddGuest): Guest to create
         organization_id (str): Organization ID
         db (Session): SQLAlchemy Session
+        task_queue (TaskQueue): Queue the invite email is submitted to
         rsvp_status (str, optional): RSVP status. Defaults to "pending".
 
     Returns:
         Guest: Guest created
     """
-
-    if db.query(Guest).filter(Guest.email == guest.email).first() is not None:
-        raise CustomException(
-            message="Guest with this email already exists",
-            status_code=409,
-        )
+    # check every tag is a uuid before touching the database
+    check_tag_ids(guest.tags or [])
 
     guest_instance = Guest(
         id=uuid4().hex,
@@ -57,95 +154,216 @@ def add_guest(
         organization_id=organization_id,
         rsvp_status=rsvp_status,
         allow_plus_one=guest.allow_plus_one,
+        invite_code=create_invite_code(get_invite_prefix(organization_id, db)),
     )
+    # every column is set client side so the instance is not refreshed
+    # after commit; tags are inserted in bulk and lazy loaded when present
+    if not guest.tags:
+        guest_instance.guest_tags = []
 
     if guest.tags is not None:
-        for tag in guest.tags:
-            # check if tag is uuid
-
-            try:
-                uuid.UUID(tag)
-            except ValueError as e:
-                print(e)
-                raise CustomException(
-                    message="Invalid tag id",
-                    status_code=400,
-                ) from e
-            if (
-                db.query(OrganizationTag)
-                .filter(OrganizationTag.id == tag)
-                .first()
-                is None
-            ):
-                continue
-            db.add(
-                GuestTags(
-                    id=uuid4().hex,
-                    guest_id=guest_instance.id,
-                    tag_id=tag,
-                )
-            )
+        # fetch the existing tags in one query, unknown ids are skipped
+        valid_tags = {
+            row.id
+            for row in db.query(OrganizationTag.id)
+            .filter(OrganizationTag.id.in_(guest.tags))
+            .all()
+        }
+        guest_tags = [
+            {"id": uuid4().hex, "guest_id": guest_instance.id, "tag_id": tag}
+            for tag in dict.fromkeys(guest.tags)
+            if tag in valid_tags
+        ]
 
     if guest.table_group is not None:
         guest_instance.table_group = guest.table_group.table_group_id
         guest_instance.table_number = guest.table_group.table_number
         guest_instance.seat_number = guest.table_group.seat_number
 
-    db.add(guest_instance)
-    db.commit()
-    db.refresh(guest_instance)
-
-    # back_groung_tasks.add_task(
-    #     send_invite_email,
-    #     guest_instance.email,
-    #     guest_instance.first_name,
-    #     guest_instance.invite_code,
-    # )
+    # duplicate emails are rejected by the unique constraint on guest.email,
+    # any other violation is raised as it is
+    try:
+        db.add(guest_instance)
+        if guest.tags:
+            # the guest row must exist before its tags reference it
+            db.flush()
+            insert_guest_tags(guest_tags, db)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if not is_duplicate_email(e):
+            raise
+        raise CustomException(
+            message="Guest with this email already exists",
+            status_code=409,
+        ) from e
+
+    # the email is sent by the service worker, not by this process
+    task_queue.enqueue(
+        "guest_invites",
+        {
+            "email": guest_instance.email,
+            "first_name": guest_instance.first_name,
+            "invite_code": guest_instance.invite_code,
+        },
+    )
 
     return CustomResponse(
         message="Guest created successfully",
-        data=GuestResponse(
-            id=guest_instance.id,
-            first_name=guest_instance.first_name,
-            last_name=guest_instance.last_name,
-            email=guest_instance.email,
-            invite_code=guest_instance.invite_code,
-            phone_number=guest_instance.phone_number,
-            location=guest_instance.location,
-            rsvp_status=guest_instance.rsvp_status,
-            has_plus_one=guest_instance.has_plus_one,
-            is_plus_one=guest_instance.is_plus_one,
-            plus_one=GuestPlusOne(
-                first_name=guest_instance.plus_one.first_name,
-                last_name=guest_instance.plus_one.last_name,
-                email=guest_instance.plus_one.email,
-            )
-            if guest_instance.plus_one
-            else GuestPlusOne(),
-            meal=GuestMeal(
-                id=guest_instance.meal.id,
-                name=guest_instance.meal.name,
-            )
-            if guest_instance.meal
-            else GuestMeal(),
-            table=GuestAssignedTable(
-                table_group=guest_instance.table_group,
-                table_number=guest_instance.table_number,
-                seat_number=guest_instance.seat_number,
+        data=build_guest_response(guest_instance),
+    )
+
+
+def bulk_add_guests(
+    guests: List[AddGuest],
+    organization_id: str,
+    db: Session,
+    task_queue: TaskQueue,
+) -> CustomResponse:
+    """Creates many guests in one transaction.
+
+    Emails that are repeated in the request or already belong to a guest
+    are skipped. Guests and their tags are inserted with one executemany
+    statement per chunk of _BULK_CHUNK_SIZE rows.
+
+    Args:
+        guests (List[AddGuest]): Guests to create
+        organization_id (str): Organization ID
+        db (Session): SQLAlchemy Session
+        task_queue (TaskQueue): Queue the invite emails are submitted to
+
+    Returns:
+        CustomResponse: Number of guests created and the skipped emails
+    """
+    unique_guests: Dict[str, AddGuest] = {}
+    skipped: List[str] = []
+    for guest in guests:
+        check_tag_ids(guest.tags or [])
+        if guest.email in unique_guests:
+            skipped.append(guest.email)
+        else:
+            unique_guests[guest.email] = guest
+
+    for emails in chunk_rows(list(unique_guests)):
+        for row in db.query(Guest.email).filter(Guest.email.in_(emails)):
+            skipped.append(row.email)
+            del unique_guests[row.email]
+
+    tag_ids = {tag for g in unique_guests.values() for tag in g.tags or []}
+    valid_tags = set()
+    if tag_ids:
+        valid_tags = {
+            row.id
+            for row in db.query(OrganizationTag.id).filter(
+                OrganizationTag.id.in_(tag_ids)
             )
-            if guest_instance.table_group
-            else GuestAssignedTable(),
-            tag_ids=[
-                GuestTagsSchema(
-                    id=tag.tag_id,
-                    name=tag.organization_tag.name,
-                )
-                for tag in guest_instance.guest_tags
-                if tag != "string"
-            ],
-        ).model_dump(),
+        }
+
+    invite_prefix = get_invite_prefix(organization_id, db)
+
+    guest_rows = []
+    guest_tags = []
+    for guest in unique_guests.values():
+        guest_id = uuid4().hex
+        table_group = guest.table_group
+        guest_rows.append(
+            {
+                "id": guest_id,
+                "first_name": guest.first_name,
+                "last_name": guest.last_name,
+                "email": guest.email,
+                "phone_number": guest.phone_number,
+                "location": guest.location,
+                "organization_id": organization_id,
+                "rsvp_status": "pending",
+                "allow_plus_one": guest.allow_plus_one,
+                "table_group": (
+                    table_group.table_group_id if table_group else None
+                ),
+                "table_number": table_group.table_number if table_group else 0,
+                "seat_number": table_group.seat_number if table_group else 0,
+                "invite_code": create_invite_code(invite_prefix),
+            }
+        )
+        guest_tags.extend(
+            {"id": uuid4().hex, "guest_id": guest_id, "tag_id": tag}
+            for tag in dict.fromkeys(guest.tags or [])
+            if tag in valid_tags
+        )
+
+    try:
+        for rows in chunk_rows(guest_rows):
+            db.execute(insert(Guest), rows)
+        for rows in chunk_rows(guest_tags):
+            insert_guest_tags(rows, db)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        # only a guest added with the same email since the lookup above
+        # is a conflict, any other violation is not the client's to fix
+        if not is_duplicate_email(e):
+            raise
+        raise CustomException(
+            message="Guest with this email already exists",
+            status_code=409,
+        ) from e
+
+    # the invites are handed to the service worker in one submission
+    task_queue.enqueue_many(
+        "guest_invites",
+        [
+            {
+                "email": row["email"],
+                "first_name": row["first_name"],
+                "invite_code": row["invite_code"],
+            }
+            for row in guest_rows
+        ],
     )
 
+    return CustomResponse(
+        message="Guests created successfully",
+        data={"created": len(guest_rows), "skipped": skipped},
+    )
+
+
+def chunk_rows(rows: List[Any]) -> Iterator[List[Any]]:
+    """Splits rows into chunks of _BULK_CHUNK_SIZE.
+
+    Args:
+        rows (List[Any]): Rows to split
+
+    Returns:
+        Iterator[List[Any]]: Chunks of the rows
+    """
+    for start in range(0, len(rows), _BULK_CHUNK_SIZE):
+        end = start + _BULK_CHUNK_SIZE
+        yield rows[start:end]
+
+
+def is_duplicate_email(error: IntegrityError) -> bool:
+    """Tells whether an insert failed on the unique email of a guest.
+
+    Args:
+        error (IntegrityError): Error raised by the insert
+
+    Returns:
+        bool: True when the unique constraint on guest.email was violated
+    """
+    return any(name in str(error.orig) for name in _GUEST_EMAIL_CONSTRAINTS)
+
+
+def escape_like(value: str) -> str:
+    """Escapes the LIKE wildcards in a value with a backslash.
+
+    Args:
+        value (str): Text to match literally
+
+    Returns:
+        str: The value with backslash, % and _ escaped
+    """
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 def fetch_all_guests(
     db: Session, organization_id: str, **kwargs
@@ -154,63 +372,30 @@ def fetch_all_guests(
 
     Args:
         db (Session): SQLAlchemy Session
-        skip (int, optional): Number of guests to skip. Defaults to 0.
+        after_created_at (datetime, optional): Cursor, creation time of the
+            last guest on the previous page.
+        after_id (str, optional): Cursor, id of the last guest on the
+            previous page.
+        skip (int, optional): Number of guests to skip, deprecated in
+            favour of the cursor. Defaults to 0.
         limit (int, optional): Number of guests to limit. Defaults to 100.
 
     Returns:
-        Dict[str, Any]: Guests fetched
+        Dict[str, Any]: Guests fetched and the cursor of the next page
     """
-    guests = (
+    guests, next_cursor = paginate_guests(
         db.query(Guest)
-        .filter(Guest.organization_id == organization_id)
-        .offset(kwargs.get("skip"))
-        .limit(kwargs.get("limit"))
-        .all()
+        .options(*_GUEST_RESPONSE_OPTIONS)
+        .filter(Guest.organization_id == organization_id),
+        **kwargs,
     )
 
     return CustomResponse(
         message="Guests fetched successfully",
-        data=[
-            GuestResponse(
-                id=guest.id,
-                first_name=guest.first_name,
-                last_name=guest.last_name,
-                email=guest.email,
-                invite_code=guest.invite_code,
-                phone_number=guest.phone_number,
-                location=guest.location,
-                rsvp_status=guest.rsvp_status,
-                has_plus_one=guest.has_plus_one,
-                is_plus_one=guest.is_plus_one,
-                plus_one=GuestPlusOne(
-                    first_name=guest.plus_one.first_name,
-                    last_name=guest.plus_one.last_name,
-                    email=guest.plus_one.email,
-                )
-                if guest.plus_one
-                else GuestPlusOne(),
-                meal=GuestMeal(
-                    id=guest.meal.id,
-                    name=guest.meal.name,
-                )
-                if guest.meal
-                else GuestMeal(),
-                table=GuestAssignedTable(
-                    table_group_id=guest.table_group,
-                    table_number=guest.table_number,
-                    seat_number=guest.seat_number,
-                ),
-                tag_ids=[
-                    GuestTags(
-                        id=tag.tag_id,
-                        name=tag.organization_tag.name,
-                    )
-                    for tag in guest.guest_tags
-                    if tag != "string"
-                ],
-            ).model_dump()
-            for guest in guests
-        ],
+        data={
+            "next_cursor": next_cursor,
+            "guests": [build_guest_response(guest) for guest in guests],
+        },
     )
 
 
@@ -225,18 +410,37 @@ def search_organization_guests(
 
     Args:
         db (Session): SQLAlchemy Session
-        email (str, optional): Email to search. Defaults to "".
+        email (str, optional): Start of the email to search, a leading %
+            searches anywhere in the email. Defaults to "".
         name (str, optional): Name to search. Defaults to "".
-        skip (int, optional): Number of guests to skip. Defaults to 0.
+        after_created_at (datetime, optional): Cursor, creation time of the
+            last guest on the previous page.
+        after_id (str, optional): Cursor, id of the last guest on the
+            previous page.
+        skip (int, optional): Number of guests to skip, deprecated in
+            favour of the cursor. Defaults to 0.
         limit (int, optional): Number of guests to limit. Defaults to 100.
 
     Returns:
-        Dict[str, Any]: Guests searched
+        Dict[str, Any]: Guests searched and the cursor of the next page
     """
-    guests = db.query(Guest).filter(Guest.organization_id == organization_id)
+    guests = (
+        db.query(Guest)
+        .options(*_GUEST_RESPONSE_OPTIONS)
+        .filter(Guest.organization_id == organization_id)
+    )
 
-    if email != "":
-        guests = guests.filter(Guest.email.ilike(f"%{email}%"))
+    # the search text is matched literally, only the leading % of an
+    # anywhere search is a wildcard
+    if email.startswith("%"):
+        pattern = escape_like(email.strip("%"))
+        guests = guests.filter(Guest.email.ilike(f"%{pattern}%", escape="\\"))
+    elif email != "":
+        # prefix searches use the b-tree on the lowercased email
+        pattern = escape_like(email.lower())
+        guests = guests.filter(
+            Guest.email_lower.like(f"{pattern}%", escape="\\")
+        )
     if name != "":
         guests = guests.filter(
             or_(
@@ -245,7 +449,7 @@ def search_organization_guests(
             )
         )
 
-    guests = guests.offset(kwargs.get("skip")).limit(kwargs.get("limit")).all()
+    guests, next_cursor = paginate_guests(guests, **kwargs)
 
     if len(guests) == 0:
         raise CustomException(
@@ -253,50 +457,58 @@ def search_organization_guests(
         )
     return CustomResponse(
         message="Guests fetched successfully",
-        data=[
-            GuestResponse(
-                id=guest.id,
-                first_name=guest.first_name,
-                last_name=guest.last_name,
-                email=guest.email,
-                invite_code=guest.invite_code,
-                phone_number=guest.phone_number,
-                location=guest.location,
-                rsvp_status=guest.rsvp_status,
-                has_plus_one=guest.has_plus_one,
-                is_plus_one=guest.is_plus_one,
-                plus_one=GuestPlusOne(
-                    first_name=guest.plus_one.first_name,
-                    last_name=guest.plus_one.last_name,
-                    email=guest.plus_one.email,
-                )
-                if guest.plus_one
-                else GuestPlusOne(),
-                meal=GuestMeal(
-                    id=guest.meal.id,
-                    name=guest.meal.name,
-                )
-                if guest.meal
-                else GuestMeal(),
-                table=GuestAssignedTable(
-                    table_group_id=guest.table_group,
-                    table_number=guest.table_number,
-                    seat_number=guest.seat_number,
-                ),
-                tag_ids=[
-                    GuestTagsSchema(
-                        id=tag.tag_id,
-                        name=tag.organization_tag.name,
-                    )
-                    for tag in guest.guest_tags
-                    if tag != "string"
-                ],
-            ).model_dump()
-            for guest in guests
-        ],
+        data={
+            "next_cursor": next_cursor,
+            "guests": [build_guest_response(guest) for guest in guests],
+        },
     )
 
 
+def paginate_guests(
+    query: Query, **kwargs
+) -> Tuple[List[Guest], Optional[Dict[str, Any]]]:
+    """
+    paginate_guests:
+        This method is used to fetch a page of guests ordered by
+        (created_at, id). Pages are addressed with a keyset cursor so each
+        page is an index range scan instead of scanning past skipped rows.
+
+    Args:
+        query: This is the guest query to paginate.
+        after_created_at: This is the created_at of the cursor.
+        after_id: This is the id of the cursor.
+        skip: This is the number of guests to skip when no cursor is
+            given, kept for backward compatibility.
+        limit: This is the number of guests to limit.
+
+    Returns:
+        Tuple: The guests on the page and the cursor of the next page,
+        None when there is no next page.
+    """
+    limit = kwargs.get("limit") or 100
+    after_created_at = kwargs.get("after_created_at")
+    after_id = kwargs.get("after_id")
+
+    query = query.order_by(Guest.created_at, Guest.id)
+    if after_created_at is not None and after_id is not None:
+        query = query.filter(
+            tuple_(Guest.created_at, Guest.id)
+            > tuple_(after_created_at, after_id)
+        )
+    elif kwargs.get("skip"):
+        query = query.offset(kwargs.get("skip"))
+
+    guests = query.limit(limit).all()
+
+    next_cursor = None
+    if len(guests) == limit:
+        next_cursor = {
+            "after_created_at": guests[-1].created_at.isoformat(),
+            "after_id": guests[-1].id,
+        }
+    return guests, next_cursor
+
+
 def update_organization_guest(
     guest_id: str,
     guest: UpdateGuest,
@@ -320,14 +532,17 @@ def update_organization_guest(
             status_code=404,
         )
 
-    attributes = ["first_name", "last_name", "phone_number", "location"]
-
-    for attr in attributes:
-        if getattr(guest, attr) != "":
-            setattr(guest_instance, attr, getattr(guest, attr))
-
+    # empty strings mean the field was not sent
+    updates = {
+        attr: value
+        for attr in _GUEST_UPDATE_FIELDS
+        if (value := getattr(guest, attr)) != ""
+    }
     if guest.allow_plus_one:
-        guest_instance.allow_plus_one = guest.allow_plus_one
+        updates["allow_plus_one"] = guest.allow_plus_one
+
+    for attr, value in updates.items():
+        setattr(guest_instance, attr, value)
 
     if guest.table_group is not None:
         guest_instance.table_group = guest.table_group.table_group_id
@@ -338,48 +553,13 @@ def update_organization_guest(
         add_tags(guest_id, guest.tags, db)
 
     db.commit()
-    db.refresh(guest_instance)
+    # only the tags were written behind the session's back
+    if guest.tags:
+        db.refresh(guest_instance, attribute_names=["guest_tags"])
 
     return CustomResponse(
         message="Guest updated successfully",
-        data=GuestResponse(
-            id=guest_instance.id,
-            first_name=guest_instance.first_name,
-            last_name=guest_instance.last_name,
-            email=guest_instance.email,
-            invite_code=guest_instance.invite_code,
-            phone_number=guest_instance.phone_number,
-            location=guest_instance.location,
-            rsvp_status=guest_instance.rsvp_status,
-            has_plus_one=guest_instance.has_plus_one,
-            is_plus_one=guest_instance.is_plus_one,
-            plus_one=GuestPlusOne(
-                first_name=guest_instance.plus_one.first_name,
-                last_name=guest_instance.plus_one.last_name,
-                email=guest_instance.plus_one.email,
-            )
-            if guest_instance.plus_one
-            else GuestPlusOne(),
-            meal=GuestMeal(
-                id=guest_instance.meal.id,
-                name=guest_instance.meal.name,
-            )
-            if guest_instance.meal
-            else GuestMeal(),
-            table=GuestAssignedTable(
-                table_group_id=guest_instance.table_group,
-                table_number=guest_instance.table_number,
-                seat_number=guest_instance.seat_number,
-            ),
-            tag_ids=[
-                GuestTagsSchema(
-                    id=tag.tag_id,
-                    name=tag.organization_tag.name,
-                )
-                for tag in guest_instance.guest_tags
-                if tag != "string"
-            ],
-        ).model_dump(),
+        data=build_guest_response(guest_instance),
     )
 
 
@@ -404,10 +584,30 @@ def generate_invite_code(db: Session, guest_id: str) -> str:
     guest.invite_code = create_invite_code(guest.organization.name[:3])
 
     db.commit()
-    db.refresh(guest)
     return "success"
 
 
+def get_invite_prefix(organization_id: str, db: Session) -> str:
+    """
+    get_invite_prefix:
+        This method is used to get the prefix of the invite codes of an
+        organization, the first three letters of its name.
+
+    Args:
+        organization_id: This is the id of the organization.
+        db: This is the database session.
+
+    Returns:
+        str: This is the prefix for the invite codes.
+    """
+    name = (
+        db.query(Organization.name)
+        .filter(Organization.id == organization_id)
+        .scalar()
+    )
+    return (name or "")[:3]
+
+
 #  function to generate unique 10 character code
 def create_invite_code(prefix: str) -> str:
     """
@@ -421,10 +621,27 @@ def create_invite_code(prefix: str) -> str:
         str: This is the invite code.
     """
 
-    code_gen = "".join(
-        secrets.choice(string.ascii_letters + string.digits) for _ in range(7)
-    )
-    return prefix + code_gen
+    # one choices call draws all 7 characters from the system rng
+    return prefix + "".join(_SYSTEM_RANDOM.choices(_INVITE_ALPHABET, k=7))
+
+
+def check_tag_ids(tags: List[str]):
+    """
+    check_tag_ids:
+        This method is used to check that every tag id is a uuid.
+
+    Args:
+        tags: This is the list of tag ids.
+
+    Raises:
+        CustomException: If a tag id is not a uuid.
+    """
+    for tag in tags:
+        if not _UUID_RE.fullmatch(tag):
+            raise CustomException(
+                message="Invalid tag id",
+                status_code=400,
+            )
 
 
 def add_tags(guest_id, tags: List[str], db: Session):
@@ -440,11 +657,36 @@ def add_tags(guest_id, tags: List[str], db: Session):
     Returns:
         None
     """
-    for i in tags:
-        db.add(
-            GuestTags(
-                id=uuid4().hex,
-                guest_id=guest_id,
-                tag_id=i,
-            )
+    # skip repeated tags and tags the guest already has, they would
+    # violate the unique (guest_id, tag_id) constraint
+    existing = {
+        row.tag_id
+        for row in db.query(GuestTags.tag_id).filter(
+            GuestTags.guest_id == guest_id
         )
+    }
+    insert_guest_tags(
+        [
+            {"id": uuid4().hex, "guest_id": guest_id, "tag_id": tag}
+            for tag in dict.fromkeys(tags)
+            if tag not in existing
+        ],
+        db,
+    )
+
+
+def insert_guest_tags(guest_tags: List[dict], db: Session):
+    """
+    insert_guest_tags:
+        This method is used to insert guest tags in a single
+        executemany statement instead of one INSERT per tag.
+
+    Args:
+        guest_tags: This is the list of guest tag rows.
+        db: This is the SQLAlchemy Session object.
+
+    Returns:
+        None
+    """
+    if guest_tags:
+        db.execute(insert(GuestTags), guest_tags)
@@ -1,26 +1,58 @@
 """This module contains function that ensure a Meal is created properly."""
 
-from typing import Any, Optional
-from uuid import uuid4
+import logging
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
 
 from fastapi import status
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy.exc import InternalError
-from sqlalchemy.orm import Session
+from sqlalchemy import exists, select, tuple_
+from sqlalchemy.exc import IntegrityError, InternalError
+from sqlalchemy.orm import Session, joinedload, lazyload
 from sqlalchemy.sql.expression import desc
 
+from app.api.models.guest_models import Guest
 from app.api.models.meal_models import Meal, MealCategory, MealTag
 from app.api.models.organization_models import Organization, OrganizationTag
 from app.api.responses.custom_responses import CustomException, CustomResponse
 from app.api.schemas.meal_schema import MealSchema, MealTagSchema
 
+logger = logging.getLogger(__name__)
+
+# the category listing of an organization is kept for a short while and
+# dropped whenever a category of that organization is created or deleted
+_MEAL_CATEGORY_CACHE: Dict[str, Tuple[float, list[dict[str, Any]]]] = {}
+_MEAL_CATEGORY_CACHE_TTL = 30
+_MEAL_CATEGORY_CACHE_SIZE = 1024
+
+# how PostgreSQL and SQLite name the unique constraint on meal tags
+_MEAL_TAG_CONSTRAINTS = (
+    "uq_meal_tag_meal_id_organization_tag_id",
+    "meal_tag.meal_id, meal_tag.organization_tag_id",
+)
+
+# the keys of a meal in the meal listing and the columns they are read from,
+# rows are selected in this order and zipped onto the keys
+_MEAL_LISTING_COLUMNS = {
+    "id": Meal.id,
+    "meal_categgory_id": Meal.meal_category_id,
+    "name": Meal.name,
+    "description": Meal.description,
+    "image_url": Meal.image_url,
+    "quantity": Meal.quantity,
+    "is_hidden": Meal.is_hidden,
+    "created_by": Meal.created_at,
+}
+
 
 def create_mc_service(org_id: str, schema: MealCategory, db: Session) -> Any:
     """Creates a new meal category for a specific organization.
 
-    This function ensures the validity of the organization ID and checks if
-    the given name for the meal category is already in use. If both conditions
-    are met, it creates a new meal category associated with the organization.
+    This function ensures the validity of the organization ID and creates a
+    new meal category associated with the organization. A name that is
+    already in use is rejected by the unique constraint on the insert.
 
     Args:
         org_id (str): ID of the organization for the new meal category.
@@ -31,10 +63,11 @@ def create_mc_service(org_id: str, schema: MealCategory, db: Session) -> Any:
        Union[CustomResponse, CustomException]: CustomResponse if meal category
        creation succeeds, CustomException for errors.
     """
-    # Checking if the organization with the given ID exists
-    valid_organization = (
-        db.query(Organization).filter(Organization.id == org_id).first()
-    )
+    # Checking if the organization with the given ID exists, as a boolean
+    # instead of loading the organization and all of its categories
+    valid_organization = db.query(
+        exists().where(Organization.id == org_id)
+    ).scalar()
 
     if not valid_organization:
         raise CustomException(
@@ -42,39 +75,40 @@ def create_mc_service(org_id: str, schema: MealCategory, db: Session) -> Any:
             message="Invalid Organization ID",
         )
 
-    # Checking if the meal category name already exists
-    existing_name = False
-
-    for category in valid_organization.meal_categories:
-        if category.name == schema.name:
-            existing_name = True
-            break
-
-    if existing_name:
-        raise CustomException(
-            status_code=status.HTTP_409_CONFLICT,
-            message="This name has already been used",
-        )
-
     # Creating a new meal category
-    new_category = MealCategory(
-        organization_id=org_id, name=schema.name, id=uuid4().hex
-    )
+    new_category = MealCategory(organization_id=org_id, name=schema.name)
 
     try:
         db.add(new_category)
         db.commit()
-        db.refresh(new_category)
+    except IntegrityError as e:
+        db.rollback()
+        raise CustomException(
+            status_code=status.HTTP_409_CONFLICT,
+            message="This name has already been used",
+        ) from e
     except InternalError as e:
-        print(e)
+        logger.exception(
+            "Failed to create meal category %s", new_category.name
+        )
         db.rollback()
         raise CustomException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             message=f"Failed to {new_category.name} Meal Category",
         ) from e  # Using 'from' to preserve the original exception context
 
-    # Returning a success response
-    return jsonable_encoder(new_category)
+    _MEAL_CATEGORY_CACHE.pop(org_id, None)
+
+    # Returning a success response built from the known columns, the
+    # joined meals and organization of the category are not rendered
+    return {
+        "id": new_category.id,
+        "name": new_category.name,
+        "organization_id": org_id,
+        "is_hidden": new_category.is_hidden,
+        "created_at": new_category.created_at,
+        "updated_at": new_category.updated_at,
+    }
 
 
 def get_meal_categories(org_id: str, db: Session) -> list[dict[str, Any]]:
@@ -89,10 +123,15 @@ def get_meal_categories(org_id: str, db: Session) -> list[dict[str, Any]]:
         meal categories.
     """
 
+    # Serve a recent listing of the organization without querying
+    cached = _MEAL_CATEGORY_CACHE.get(org_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     # Checking if the organization with the given ID exists
-    valid_organization = (
-        db.query(Organization).filter(Organization.id == org_id).first()
-    )
+    valid_organization = db.query(
+        exists().where(Organization.id == org_id)
+    ).scalar()
 
     if not valid_organization:
         raise CustomException(
@@ -100,25 +139,32 @@ def get_meal_categories(org_id: str, db: Session) -> list[dict[str, Any]]:
             message="Invalid Organization ID",
         )
 
-    # Retrieve all records from the MealCategory table
-    meal_categories = (
-        db.query(MealCategory)
-        .filter(MealCategory.organization_id == org_id)
-        .all()
-    )
-
-    # Convert the SQLAlchemy objects into dictionaries
-    meal_category_list = []
-    for meal_category in meal_categories:
-        # Serialize meals into dictionaries before push to meal_category_dict
-        meal_category_dict = {
-            "id": meal_category.id,
-            "name": meal_category.name,
-            "created at": meal_category.created_at.strftime(
+    # Retrieve only the rendered columns as plain core rows, the joined
+    # meals and organization of each category are not needed here
+    meal_categories = db.execute(
+        select(
+            MealCategory.id, MealCategory.name, MealCategory.created_at
+        ).where(MealCategory.organization_id == org_id)
+    ).mappings()
+
+    meal_category_list = [
+        {
+            "id": meal_category["id"],
+            "name": meal_category["name"],
+            "created at": meal_category["created_at"].strftime(
                 "%Y-%m-%d %H:%M:%S"
             ),
         }
-        meal_category_list.append(meal_category_dict)
+        for meal_category in meal_categories
+    ]
+
+    # Evict the oldest listing once the cache is full
+    if len(_MEAL_CATEGORY_CACHE) >= _MEAL_CATEGORY_CACHE_SIZE:
+        _MEAL_CATEGORY_CACHE.pop(next(iter(_MEAL_CATEGORY_CACHE)), None)
+    _MEAL_CATEGORY_CACHE[org_id] = (
+        time.monotonic() + _MEAL_CATEGORY_CACHE_TTL,
+        meal_category_list,
+    )
 
     return meal_category_list
 
@@ -128,9 +174,11 @@ def fetch_meal_category_by_id(
 ) -> MealCategory:
     """Gets a meal categories that exist from the ID provided."""
 
-    # Retrieve all records from the MealCategory table
+    # Retrieve the category with its meals, the organization is not
+    # rendered and is not joined in
     meal_category = (
         db.query(MealCategory)
+        .options(lazyload(MealCategory.organization))
         .filter(MealCategory.id == meal_category_id)
         .first()
     )
@@ -157,6 +205,7 @@ def delete_meal_category_service(meal_category_id: str, db: Session) -> bool:
     if existing_meal_cat:
         db.delete(existing_meal_cat)
         db.commit()
+        _MEAL_CATEGORY_CACHE.pop(existing_meal_cat.organization_id, None)
     else:
         raise CustomException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -188,12 +237,11 @@ def create_meal_service(
         CustomResponse if meal creation succeeds, CustomException for errors.
     """
 
-    # Check if meal category exists
-    valid_meal_category = (
-        db.query(MealCategory)
-        .filter(MealCategory.id == meal_category_id)
-        .first()
-    )
+    # Check if meal category exists, as a boolean instead of loading the
+    # category with its meals and organization
+    valid_meal_category = db.query(
+        exists().where(MealCategory.id == meal_category_id)
+    ).scalar()
 
     # if meal category doesn't exist throw 404 Not Found
     if not valid_meal_category:
@@ -204,7 +252,6 @@ def create_meal_service(
 
     meal_item = meal_schema.model_dump()
     meal_item["meal_category_id"] = meal_category_id
-    meal_item["id"] = uuid4().hex
     meal_item["organization_id"] = org_id
 
     # Compiling attributes to make up a meal model
@@ -213,18 +260,21 @@ def create_meal_service(
     try:
         db.add(new_meal)
         db.commit()
-        db.refresh(new_meal)
 
-        # Return response message or None
+        # Return response message or None, built from the meal item
+        # instead of walking the joined relationships of the new meal
+        meal_item["id"] = new_meal.id
+        meal_item["created_at"] = new_meal.created_at
+        meal_item["updated_at"] = new_meal.updated_at
         response = CustomResponse(
             status_code=status.HTTP_201_CREATED,
             message=f"{new_meal.name} meal Successfully added",
-            data=jsonable_encoder(new_meal),
+            data=meal_item,
         )
         return response, None
 
-    except InternalError as e:
-        print(e)
+    except InternalError:
+        logger.exception("Failed to create meal %s", new_meal.name)
         db.rollback()
         exception = CustomException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -243,8 +293,17 @@ def get_meal_service(
     organization_id: str,
     meal_category_id: Optional[str] = None,
     ishidden: Optional[bool] = False,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[str] = None,
+    include_tags: bool = False,
 ) -> Any:
-    """Get all meals in the database."""
+    """Get all meals in the database.
+
+    Pages are addressed with a keyset cursor on (created_at, id), so each
+    page is an index range scan instead of scanning past skipped rows. The
+    offset is only applied when no cursor is given. The tags of the meals
+    on the page are read in one query when include_tags is set.
+    """
     if sort_by == "meal category":
         if meal_category_id is None:
             raise CustomException(
@@ -264,54 +323,115 @@ def get_meal_service(
     if sort_by == "all":
         query = db.query(Meal).filter(Meal.is_hidden == ishidden)
 
-    # Order the query
+    # Select only the rendered columns of the meals as plain rows, no meal
+    # objects or their joined categories, tags and organizations are built
+    query = query.with_entities(*_MEAL_LISTING_COLUMNS.values())
+
+    # Order the query, the id breaks ties between meals created together
+    # so the cursor points at exactly one row
+    use_cursor = after_created_at is not None and after_id is not None
     if order == "desc":
-        query = query.order_by(desc(Meal.created_at))
+        query = query.order_by(desc(Meal.created_at), desc(Meal.id))
+        after = tuple_(Meal.created_at, Meal.id) < tuple_(
+            after_created_at, after_id
+        )
     else:
-        query = query.order_by(Meal.created_at)
-    # Calculate total count before applying limit and offset
-    total = query.count()
+        query = query.order_by(Meal.created_at, Meal.id)
+        after = tuple_(Meal.created_at, Meal.id) > tuple_(
+            after_created_at, after_id
+        )
+    # Count the meals on the first page only, later pages know whether
+    # there is a next page from the one extra row they fetch
+    total = None
+    if not use_cursor and offset == 0:
+        total = query.order_by(None).count()
 
     # Initialize next_url and previous_url
     next_url = None
     previous_url = None
 
-    # Apply limit and offset
-    if total > 1:
-        query = query.offset(offset).limit(limit)
-        next_offset = offset + limit
-        if next_offset < total:
-            next_url = f"/{organization_id}/meal-management/meal?\
-meal_category_id={meal_category_id}&ishidden={ishidden}&limit=\
-{limit}&offset={next_offset}"
+    # Apply limit and the cursor or offset
+    if use_cursor:
+        query = query.filter(after)
+    else:
+        query = query.offset(offset)
+
+    meals = query.limit(limit + 1).all()
+    has_next = len(meals) > limit
+    meals = meals[:limit]
+
+    if not use_cursor:
+        if has_next:
+            next_url = _meal_page_url(
+                organization_id,
+                meal_category_id,
+                ishidden,
+                limit,
+                offset + limit,
+            )
 
         if offset - limit >= 0:
-            previous_url = f"/{organization_id}/meal-management/meal?\
-meal_category_id={meal_category_id}&ishidden={ishidden}&limit=\
-{limit}&offset={offset - limit}"
+            previous_url = _meal_page_url(
+                organization_id,
+                meal_category_id,
+                ishidden,
+                limit,
+                offset - limit,
+            )
+
+    next_cursor = None
+    if has_next:
+        next_cursor = {
+            "after_created_at": meals[-1].created_at.isoformat(),
+            "after_id": meals[-1].id,
+        }
+
+    meal_list = [dict(zip(_MEAL_LISTING_COLUMNS, item)) for item in meals]
 
-    meals = query.all()
+    if include_tags:
+        meal_tags = get_meal_tags_bulk([meal["id"] for meal in meal_list], db)
+        for meal in meal_list:
+            meal["tags"] = meal_tags.get(meal["id"], [])
 
     return {
         "total": total,
+        "next_cursor": next_cursor,
         "next_page_url": next_url,
         "previous_page_url": previous_url,
-        "Meals": [
-            {
-                "id": item.id,
-                "meal_categgory_id": item.meal_category_id,
-                "name": item.name,
-                "description": item.description,
-                "image_url": item.image_url,
-                "quantity": item.quantity,
-                "is_hidden": item.is_hidden,
-                "created_by": item.created_at,
-            }
-            for item in meals
-        ],
+        "Meals": meal_list,
     }
 
 
+def _meal_page_url(
+    organization_id: str,
+    meal_category_id: Optional[str],
+    ishidden: Optional[bool],
+    limit: int,
+    offset: int,
+) -> str:
+    """Builds the url of a page of the meal listing.
+
+    Args:
+        organization_id (str): ID of the organization of the meals.
+        meal_category_id (str, optional): ID of the category of the meals.
+        ishidden (bool, optional): Whether the meals are hidden.
+        limit (int): Number of meals on the page.
+        offset (int): Number of meals before the page.
+
+    Returns:
+        str: The url of the page, with the query parameters escaped.
+    """
+    query = urlencode(
+        {
+            "meal_category_id": meal_category_id,
+            "ishidden": ishidden,
+            "limit": limit,
+            "offset": offset,
+        }
+    )
+    return f"/{organization_id}/meal-management/meal?{query}"
+
+
 def fetch_meal_by_id(meal_id: str, db: Session) -> Meal:
     """Gets a meal categories that exist from the ID provided."""
 
@@ -329,31 +449,47 @@ def fetch_meal_by_id(meal_id: str, db: Session) -> Meal:
 def delete_meal_service(meal_id: str, db: Session) -> bool:
     """Delete a meal from the meal database."""
 
-    # check if the meal exists
-    existing_meal = db.query(Meal).filter(Meal.id == meal_id).first()
+    # the guests' foreign key has no cascade, so clear the meal from
+    # the guests that chose it first. The tags and the meal are deleted
+    # without loading them. The deleted row count tells whether the
+    # meal exists.
+    db.query(Guest).filter(Guest.meal_id == meal_id).update(
+        {Guest.meal_id: None}, synchronize_session=False
+    )
+    db.query(MealTag).filter(MealTag.meal_id == meal_id).delete(
+        synchronize_session=False
+    )
+    deleted = (
+        db.query(Meal)
+        .filter(Meal.id == meal_id)
+        .delete(synchronize_session=False)
+    )
 
-    if existing_meal:
-        db.delete(existing_meal)
-        db.commit()
-    else:
+    if not deleted:
+        db.rollback()
         raise CustomException(
             status_code=status.HTTP_404_NOT_FOUND,
             message="The meal_id provided doesn't exist",
         )
 
+    db.commit()
+
     return True
 
 
 def hide_meal_service(meal_id: str, db: Session) -> bool:
     """Hides a meal from the meal database."""
 
-    # check if the meal exists
-    existing_meal = db.query(Meal).filter(Meal.id == meal_id).first()
+    # hide the meal without loading it, the updated row count tells
+    # whether the meal exists
+    updated = (
+        db.query(Meal)
+        .filter(Meal.id == meal_id)
+        .update({Meal.is_hidden: True}, synchronize_session=False)
+    )
+    db.commit()
 
-    if existing_meal:
-        existing_meal.is_hidden = True
-        db.commit()
-    else:
+    if not updated:
         raise CustomException(
             status_code=status.HTTP_404_NOT_FOUND,
             message="The meal_id provided doesn't exist",
@@ -367,76 +503,79 @@ def create_meal_tag(
 ) -> MealTagSchema:
     """Create a Meal Tag / Organization Tag."""
 
-    # Check if the organization tag name exists else create it
+    # Checking the meal exists in the organization as a boolean, the
+    # foreign key alone would not tell a missing meal from a duplicate tag
+    valid_meal = db.query(
+        exists().where(Meal.id == meal_id, Meal.organization_id == org_id)
+    ).scalar()
+
+    if not valid_meal:
+        raise CustomException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            message="Meal not found",
+        )
+
+    # Check if the organization tag name exists else create it, names of
+    # meal tags are stored case-folded
     existing_tag = (
         db.query(OrganizationTag)
-        .filter(OrganizationTag.name == tag_name.lower())
+        .filter(
+            OrganizationTag.organization_id == org_id,
+            OrganizationTag.name == tag_name.lower(),
+        )
         .first()
     )
 
-    if not existing_tag:
-        tag: OrganizationTag = create_org_tag(org_id, tag_name, "dietary", db)
-
-        tag_id = tag["id"]
-
-    else:
-        tag = jsonable_encoder(existing_tag)
-
-        # Check if the tag has been added to meal
-        unique_meal_tag = (
-            db.query(MealTag)
-            .filter(
-                MealTag.organization_tag_id == tag["id"],
-                MealTag.meal_id == meal_id,
-            )
-            .first()
-        )
-        if unique_meal_tag:
-            raise CustomException(
-                status_code=status.HTTP_409_CONFLICT,
-                message=f"{tag_name} tag has already been added to this meal",
-            )
-
-        tag_id = tag["id"]
-
-    # Create the meal tag with all the sufficient Ids available
-    meal_tag_data = MealTag(
-        id=uuid4().hex, organization_tag_id=tag_id, meal_id=meal_id
+    organization_tag = existing_tag or create_org_tag(
+        org_id, tag_name, "dietary", db
     )
 
-    # return the tag jsonable encoder
-    db.add(meal_tag_data)
-    db.commit()
-    db.refresh(meal_tag_data)
+    # Create the meal tag against the organization tag, a new organization
+    # tag is inserted in the same flush and both are committed together
+    meal_tag_data = MealTag(organization_tag=organization_tag, meal_id=meal_id)
+
+    # every rendered column is set before the insert so nothing is
+    # selected again after the commit, a tag that was already added to the
+    # meal is rejected by the unique constraint on the insert
+    try:
+        db.add(meal_tag_data)
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if not any(name in str(e.orig) for name in _MEAL_TAG_CONSTRAINTS):
+            raise
+        raise CustomException(
+            status_code=status.HTTP_409_CONFLICT,
+            message=f"{tag_name} tag has already been added to this meal",
+        ) from e
 
     return MealTagSchema(
         id=meal_tag_data.id,
-        name=tag["name"],
-        organization_tag_id=meal_tag_data.organization_tag_id,
+        name=organization_tag.name,
+        organization_tag_id=organization_tag.id,
         meal_id=meal_tag_data.meal_id,
-        created_at=tag["created_at"],
+        created_at=organization_tag.created_at,
     )
 
 
 def create_org_tag(
     org_id: int, tag_name: str, tag_type: str, db: Session
 ) -> OrganizationTag:
-    """This Endpoint is creates an organization tag."""
+    """This function adds an organization tag to the session.
+
+    The tag is not committed here, the caller commits it together with
+    whatever it creates against the tag.
+    """
 
     org_tag_data = OrganizationTag(
-        id=uuid4().hex,
         organization_id=org_id,
         name=tag_name.lower(),
         tag_type=tag_type,
     )
 
     db.add(org_tag_data)
-    db.commit()
-    db.refresh(org_tag_data)
-
-    tag: OrganizationTag = jsonable_encoder(org_tag_data)
 
-    return tag
+    return org_tag_data
 
 
 def get_all_meal_tag_service(
@@ -445,7 +584,7 @@ def get_all_meal_tag_service(
 ) -> Any:
     """Get all meals in the database."""
 
-    existing_meal = db.query(Meal).filter(Meal.id == meal_id).first()
+    existing_meal = db.query(exists().where(Meal.id == meal_id)).scalar()
 
     if not existing_meal:
         raise CustomException(
@@ -453,37 +592,70 @@ def get_all_meal_tag_service(
             message="Meal not found",
         )
 
-    tags = db.query(MealTag).filter(MealTag.meal_id == meal_id).all()
+    tag_list = get_meal_tags_bulk([meal_id], db).get(meal_id, [])
 
-    tag_list: list[MealTagSchema] = []
+    total = len(tag_list)
 
-    for tag in tags:
-        query = (
-            db.query(OrganizationTag)
-            .filter_by(id=tag.organization_tag_id)
-            .first()
+    return {"total": total, "tags": tag_list}
+
+
+def get_meal_tags_bulk(
+    meal_ids: list[str], db: Session
+) -> Dict[str, list[MealTagSchema]]:
+    """Gets the tags of several meals at once.
+
+    Args:
+        meal_ids (list[str]): IDs of the meals.
+        db (Session): Database session.
+
+    Returns:
+        Dict[str, list[MealTagSchema]]: The tags of each meal by meal ID,
+        meals without tags are left out.
+    """
+
+    # Retrieve the rendered columns of the tags and their organization tags
+    # in one join, without building meal tag and organization tag objects
+    tags = (
+        db.query(
+            MealTag.id,
+            MealTag.organization_tag_id,
+            MealTag.meal_id,
+            OrganizationTag.name,
+            OrganizationTag.created_at,
+        )
+        .join(
+            OrganizationTag, OrganizationTag.id == MealTag.organization_tag_id
         )
+        .filter(MealTag.meal_id.in_(meal_ids))
+        .all()
+    )
 
-        if query:
-            # Create an instance of MealTagSchema and append it to tag_list
-            meal_tag_schema = MealTagSchema(
+    meal_tags: Dict[str, list[MealTagSchema]] = defaultdict(list)
+    for tag in tags:
+        meal_tags[tag.meal_id].append(
+            MealTagSchema(
                 id=tag.id,
-                name=query.name,
+                name=tag.name,
                 organization_tag_id=tag.organization_tag_id,
                 meal_id=tag.meal_id,
-                created_at=query.created_at,
+                created_at=tag.created_at,
             )
-            tag_list.append(meal_tag_schema)
+        )
 
-    total = len(tag_list)
-
-    return {"total": total, "tags": tag_list}
+    return meal_tags
 
 
 def fetch_meal_tag_by_id(meal_tag_id: str, db: Session) -> MealTag:
     """Gets a meal tag with the ID provided."""
 
-    meal_tag = db.query(MealTag).filter(MealTag.id == meal_tag_id).first()
+    # the organization tag is joined onto the meal tag, so its name is
+    # read in the same query
+    meal_tag = (
+        db.query(MealTag)
+        .options(joinedload(MealTag.organization_tag))
+        .filter(MealTag.id == meal_tag_id)
+        .first()
+    )
 
     if not meal_tag:
         raise CustomException(
@@ -491,13 +663,7 @@ def fetch_meal_tag_by_id(meal_tag_id: str, db: Session) -> MealTag:
             message="Meal Tag not found",
         )
 
-    tag = (
-        db.query(OrganizationTag)
-        .filter(OrganizationTag.id == meal_tag.organization_tag_id)
-        .first()
-    )
-
-    return tag.name, meal_tag
+    return meal_tag.organization_tag.name, meal_tag
 
 
 def delete_meal_tag_service(meal_tag_id: str, db: Session) -> bool:
@@ -4,8 +4,9 @@ from typing import Any, Dict, List
 from uuid import uuid4
 
 from fastapi import BackgroundTasks
+from sqlalchemy import and_, exists, insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, lazyload, load_only
 from sqlalchemy.sql.expression import asc
 
 from app.api.models.account_models import Account
@@ -16,6 +17,7 @@ from app.api.models.organization_models import (
     OrganizationMember,
     OrganizationRole,
 )
+from app.api.models.role_models import Role
 from app.api.responses.custom_responses import CustomException
 from app.api.schemas.organization_schemas import (
     InviteMemberSchema,
@@ -25,10 +27,12 @@ from app.api.schemas.organization_schemas import (
 from app.core.config import settings
 from app.services.account_services import generate_token, hash_password
 from app.services.email_services import send_email_api
-from app.services.roles_services import RoleService
 
+# the default roles every organization starts with, its owner is the admin
+_DEFAULT_ORGANIZATION_ROLES = ("Admin", "Event Planner", "Guest Manager")
 
-async def create_organization(
+
+def create_organization(
     db: Session,
     account_id: str,
     organization: OrganizationCreate,
@@ -49,14 +53,14 @@ async def create_organization(
     """
     organization_name = organization.name.title()
 
-    if (
-        db.query(Organization)
-        .filter(
+    # Check for an organization of the same name as a boolean instead of
+    # loading it with its joined relationships
+    if db.query(
+        exists().where(
             Organization.name == organization_name,
             Organization.owner == account_id,
         )
-        .first()
-    ):
+    ).scalar():
         raise CustomException(
             status_code=400,
             message="Organization already exists",
@@ -77,35 +81,32 @@ async def create_organization(
         ),
     )
     db.add(org)
-    role_admin = RoleService().get_default_role(db=db, name="Admin")
-    role_event_planner: RoleService = RoleService().get_default_role(
-        db=db, name="Event Planner"
-    )
-    role_guest = RoleService().get_default_role(db=db, name="Guest Manager")
-    org_role = RoleService().add_role_to_organization(
-        db, org.id, role_id=role_admin.id
-    )
-    RoleService().add_role_to_organization(
-        db, org.id, role_id=role_event_planner.id
-    )
-    RoleService().add_role_to_organization(db, org.id, role_id=role_guest.id)
-
-    RoleService().assign_role(
-        organization_id=org.id,
-        db=db,
-        organization_role_id=org_role.id,
-        account_id=account_id,
+    # read the default roles in one query and add them to the organization
+    # with the owner as its admin, everything is inserted in one flush
+    default_roles = (
+        db.query(Role)
+        .filter_by(is_default=True)
+        .filter(Role.name.in_(_DEFAULT_ORGANIZATION_ROLES))
+        .all()
     )
+    org_roles = {
+        role.name: OrganizationRole(
+            id=uuid4().hex, organization_id=org_id, role_id=role.id
+        )
+        for role in default_roles
+    }
+    db.add_all(org_roles.values())
 
     org_member_instance = OrganizationMember(
         id=uuid4().hex,
         account_id=account_id,
-        organization_role_id=org_role.id,
+        organization_role_id=org_roles["Admin"].id,
         organization_id=org.id,
     )
     db.add(org_member_instance)
+    # the insert already holds every column that is returned below, so
+    # the organization is not selected again after the commit
     db.commit()
-    db.refresh(org)
 
     background_tasks.add_task(
         send_email_api,
@@ -142,32 +143,48 @@ def get_all_organizations(
     Returns:
         List[Dict[str, Any]]: List of organizations
     """
+    # select only the rendered columns of the organizations and their
+    # details in one join, none of the relationships that members and
+    # organizations join in by default are loaded
     query = (
-        db.query(OrganizationMember)
+        db.query(
+            Organization.id,
+            Organization.name,
+            Organization.description,
+            Organization.logo,
+            OrganizationDetail.website,
+            OrganizationDetail.event_date,
+            OrganizationDetail.event_start_time,
+            OrganizationDetail.event_end_time,
+        )
+        .select_from(OrganizationMember)
+        .join(
+            Organization, Organization.id == OrganizationMember.organization_id
+        )
+        .join(
+            OrganizationDetail,
+            OrganizationDetail.organization_id == Organization.id,
+        )
         .filter(OrganizationMember.account_id == account_id)
         .order_by(asc(OrganizationMember.created_at))
         .all()
     )
 
-    organizations = []
-    for organization in query:
-        event_date = organization.organization.detail.event_date
-        event_start_time = organization.organization.detail.event_start_time
-        event_end_time = organization.organization.detail.event_end_time
-        organizations.append(
-            {
-                "id": organization.organization.id,
-                "name": organization.organization.name,
-                "description": organization.organization.description,
-                "logo": organization.organization.logo,
-                "event_details": {
-                    "website": organization.organization.detail.website,
-                    "event_date": str(event_date),
-                    "event_start_time": str(event_start_time),
-                    "event_end_time": str(event_end_time),
-                },
-            }
-        )
+    organizations = [
+        {
+            "id": organization.id,
+            "name": organization.name,
+            "description": organization.description,
+            "logo": organization.logo,
+            "event_details": {
+                "website": organization.website,
+                "event_date": str(organization.event_date),
+                "event_start_time": str(organization.event_start_time),
+                "event_end_time": str(organization.event_end_time),
+            },
+        }
+        for organization in query
+    ]
 
     return organizations
 
@@ -211,7 +228,7 @@ def get_organization(db: Session, organization_id: str) -> Dict[str, Any]:
     }
 
 
-async def get_members(
+def get_members(
     db: Session,
     organization_id: str,
 ) -> List[Dict[str, Any]]:
@@ -227,54 +244,57 @@ async def get_members(
     Returns:
         List[Dict[str, Any]]: List of invites
     """
-    organization = check_organization_exists(
-        db, organization_id=organization_id
+    # the rendered relationships are joined into the member query, the
+    # organization is not loaded per member
+    query = (
+        db.query(InviteMember.is_accepted, OrganizationMember)
+        .join(
+            OrganizationMember,
+            and_(
+                OrganizationMember.account_id == InviteMember.account_id,
+                OrganizationMember.organization_id
+                == InviteMember.organization_id,
+            ),
+        )
+        .filter(InviteMember.organization_id == organization_id)
+        .options(
+            joinedload(OrganizationMember.account),
+            joinedload(OrganizationMember.member_role).joinedload(
+                OrganizationRole.role
+            ),
+            lazyload(OrganizationMember.organization),
+        )
+        .all()
     )
-    if not organization:
+    # only an empty result needs telling apart from a missing organization
+    if not query and not organization_exists(db, organization_id):
         raise CustomException(
             status_code=404,
             message="Organization not found",
             data={"organization_id": organization_id},
         )
 
-    query = db.query(InviteMember, OrganizationMember).filter(
-        InviteMember.organization_id == organization_id
-    )
-    query = query.join(
-        OrganizationMember,
-        OrganizationMember.account_id == InviteMember.account_id,
-    )
-    query = query.filter(
-        OrganizationMember.account_id == InviteMember.account_id
-    )
-    query.all()
-
-    members = []
-    unverified_members = []
-    suspended_members = []
-
-    for member in query:
-        member_dict = {
-            "id": member[1].id,
-            "name": f"{member[1].account.first_name} \
-{member[1].account.last_name or ''}",
-            "email": member[1].account.email,
-            "role": member[1].member_role.role.name,
-            "is_accepted": member[0].is_accepted,
-            "is_suspended": member[1].is_suspended,
-        }
-
-        if member[0].is_accepted and not member[1].is_suspended:
-            members.append(member_dict)
-        elif not member[0].is_accepted and not member[1].is_suspended:
-            unverified_members.append(member_dict)
-        if member[1].is_suspended:
-            suspended_members.append(member_dict)
+    member_list = [
+        serialize_member(
+            member,
+            is_accepted=is_accepted,
+            is_suspended=member.is_suspended,
+        )
+        for is_accepted, member in query
+    ]
 
     data = {
-        "members": members,
-        "unverified_members": unverified_members,
-        "suspended_members": suspended_members,
+        "members": [
+            m
+            for m in member_list
+            if m["is_accepted"] and not m["is_suspended"]
+        ],
+        "unverified_members": [
+            m
+            for m in member_list
+            if not m["is_accepted"] and not m["is_suspended"]
+        ],
+        "suspended_members": [m for m in member_list if m["is_suspended"]],
     }
     return data
 
@@ -295,8 +315,12 @@ def update_organization_details(
     Returns:
         dict: Organization details
     """
-    organization: Organization = check_organization_exists(
-        db, organization_id=organization_id
+    # only the detail is updated and rendered with the organization
+    organization: Organization = (
+        db.query(Organization)
+        .options(lazyload("*"), joinedload(Organization.detail))
+        .filter(Organization.id == organization_id)
+        .first()
     )
     if not organization:
         raise CustomException(
@@ -366,10 +390,26 @@ def invite_member(
     Returns:
         dict: Member details
     """
-    # Check if organization exists
-    organization = check_organization_exists(
-        db, organization_id=organization_id
-    )
+    # Check if organization and role exist in one query, loading only
+    # what the invite email renders instead of every joined relationship
+    organization, role = (
+        db.query(Organization, OrganizationRole)
+        .outerjoin(
+            OrganizationRole,
+            and_(
+                OrganizationRole.organization_id == Organization.id,
+                OrganizationRole.role_id == member.role_id,
+            ),
+        )
+        .filter(Organization.id == organization_id)
+        .options(
+            load_only(Organization.name, Organization.owner),
+            joinedload(Organization.account),
+            joinedload(OrganizationRole.role),
+            lazyload("*"),
+        )
+        .first()
+    ) or (None, None)
     if not organization:
         raise CustomException(
             status_code=404,
@@ -377,13 +417,6 @@ def invite_member(
             data={"organization_id": organization_id},
         )
 
-    # Check if role exists
-    role = (
-        db.query(OrganizationRole)
-        .filter(OrganizationRole.organization_id == organization_id)
-        .filter(OrganizationRole.role_id == member.role_id)
-        .first()
-    )
     if not role:
         raise CustomException(
             status_code=400,
@@ -391,103 +424,100 @@ def invite_member(
             data={"role_id": member.role_id},
         )
 
-    # Check if member has an account
-    member_account = (
-        db.query(Account).filter(Account.email == member.email).first()
-    )
-    if not member_account:
-        # Create account
-        # try:
-        # split name to get first and last name
-        name = member.name.split(" ")
-        first_name = name[0]
-        last_name = name[1] if len(name) > 1 else ""
-
-        try:
-            acc_id = uuid4().hex
-            account = Account(
-                id=acc_id,
-                email=member.email,
-                first_name=first_name,
-                last_name=last_name,
-                password_hash=hash_password(settings.AUTH_SECRET_KEY),
-            )
-            db.add(account)
-
-            member_account = OrganizationMember(
-                id=uuid4().hex,
-                account_id=acc_id,
-                organization_role_id=role.id,
-                organization_id=organization_id,
-            )
-            db.add(member_account)
-
-            invite = InviteMember(
-                id=uuid4().hex,
-                account_id=acc_id,
-                organization_id=organization_id,
-                invite_token=generate_token(
-                    data={
-                        "account_id": acc_id,
-                        "organization_id": organization_id,
-                    },
-                    expire_mins=4320,
-                ),
-            )
-            db.add(invite)
-
-            db.commit()
-        except SQLAlchemyError as exc:
-            db.rollback()
-            raise CustomException(
-                status_code=500,
-                message="Failed to create account",
-                data={"email": member.email},
-            ) from exc
-        finally:
-            db.refresh(account)
-            db.refresh(member_account)
-            db.refresh(invite)
-    else:
-        # Check if member has already accepted invite
-        invite = (
-            db.query(InviteMember)
-            .filter(InviteMember.account_id == member_account.id)
-            .filter(InviteMember.organization_id == organization_id)
-            .first()
-        )
-        if invite is not None:
+    # Check if member has an account and was already invited
+    member_account, is_invited = (
+        db.query(
+            Account,
+            exists().where(
+                InviteMember.account_id == Account.id,
+                InviteMember.organization_id == organization_id,
+            ),
+        )
+        .filter(Account.email == member.email)
+        .first()
+    ) or (None, False)
+    if member_account:
+        # Check if member has already been invited
+        if is_invited:
             raise CustomException(
                 status_code=400,
                 message="Member has already been invited",
                 data={"email": member.email},
             )
+        account_id = member_account.id
+        first_name = member_account.first_name
+    else:
+        # split name to get first and last name of the new account
+        first_name, _, last_name = member.name.partition(" ")
+        account_id = uuid4().hex
+        member_id = uuid4().hex
+
+        # hashing is slow, keep it out of the open transaction below
+        password_hash = hash_password(settings.AUTH_SECRET_KEY)
 
-        # Invite member
-        invite = InviteMember(
-            id=uuid4().hex,
-            account_id=member_account.id,
-            organization_id=organization_id,
-            invite_token=generate_token(
-                data={
-                    "account_id": member_account.id,
+    invite_token = generate_token(
+        data={"account_id": account_id, "organization_id": organization_id},
+        expire_mins=4320,
+    )
+    invite_id = uuid4().hex
+    # the rows are plain inserts with every key known up front, so they
+    # go through core statements instead of the unit of work
+    try:
+        if not member_account:
+            db.execute(
+                insert(Account),
+                [
+                    {
+                        "id": account_id,
+                        "email": member.email,
+                        "first_name": first_name,
+                        "last_name": last_name,
+                        "password_hash": password_hash,
+                    }
+                ],
+            )
+            db.execute(
+                insert(OrganizationMember),
+                [
+                    {
+                        "id": member_id,
+                        "account_id": account_id,
+                        "organization_role_id": role.id,
+                        "organization_id": organization_id,
+                    }
+                ],
+            )
+        db.execute(
+            insert(InviteMember),
+            [
+                {
+                    "id": invite_id,
+                    "account_id": account_id,
                     "organization_id": organization_id,
-                },
-                expire_mins=4320,
-            ),
+                    "invite_token": invite_token,
+                }
+            ],
         )
-        db.add(invite)
         db.commit()
+    except SQLAlchemyError as exc:
+        db.rollback()
+        raise CustomException(
+            status_code=500,
+            message="Failed to invite member"
+            if member_account
+            else "Failed to create account",
+            data={"email": member.email},
+        ) from exc
 
     invite_url = f"{settings.FRONT_END_HOST}/\
-        organization/invite/accept/{invite.invite_token}"
+        organization/invite/accept/{invite_token}"
     background_tasks.add_task(
         send_email_api,
         subject=f"Invitation to join {organization.name}",
         recipient_email=member.email,
         template="_email_invitation_for_collaboration.html",
         kwargs={
-            "name": member_account.first_name,
+            "name": first_name,
             "organization_owner_email": organization.account.email,
             "organization_name": organization.name,
             "role": role.role.name,
@@ -496,7 +526,7 @@ def invite_member(
         },
     )
     return {
-        "id": member_account.id,
+        "id": account_id,
         "name": member.name,
         "email": member.email,
         "role": role.role.name,
@@ -524,9 +554,12 @@ def resend_invite(
     Returns:
         dict: Invite details
     """
-    # Check if organization exists
-    organization = check_organization_exists(
-        db, organization_id=organization_id
+    # Check if organization exists, only its owner is rendered with it
+    organization = (
+        db.query(Organization)
+        .options(lazyload("*"), joinedload(Organization.account))
+        .filter(Organization.id == organization_id)
+        .first()
     )
     if not organization:
         raise CustomException(
@@ -575,15 +608,16 @@ def resend_invite(
 
     invite_url = f"{settings.FRONT_END_HOST}/organization/\
         invite/accept/{invite.invite_token}"
+    account = member.account
     background_tasks.add_task(
         send_email_api,
         subject=f"Invitation to join {organization.name}",
-        recipient_email=member.account.email,
+        recipient_email=account.email,
         template="_email_invitation_for_collaboration.html",
         kwargs={
-            "name": member.account.first_name,
+            "name": account.first_name,
             "organization_owner_email": organization.account.email,
-            "organization_name": member.organization.name,
+            "organization_name": organization.name,
             "role": member.member_role.role.name,
             "invitation_url": invite_url,
             "expiry_time": "3 days",
@@ -605,9 +639,16 @@ def accept_invite(db: Session, invite_token: str) -> Dict[str, Any]:
     Returns:
         dict: Member details
     """
-    # Check if invite token is valid
+    # Check if invite token is valid, loading what the response renders
     member = (
         db.query(InviteMember)
+        .options(
+            joinedload(InviteMember.account),
+            joinedload(InviteMember.organization).options(
+                load_only(Organization.name), lazyload("*")
+            ),
+            lazyload(InviteMember.member),
+        )
         .filter(InviteMember.invite_token == invite_token)
         .first()
     )
@@ -627,17 +668,27 @@ def accept_invite(db: Session, invite_token: str) -> Dict[str, Any]:
             data={"invite_token": invite_token},
         )
 
-    role = (
-        db.query(OrganizationRole)
+    role_name = (
+        db.query(Role.name)
+        .join(OrganizationRole, OrganizationRole.role_id == Role.id)
         .join(
             OrganizationMember,
             OrganizationMember.organization_role_id == OrganizationRole.id,
         )
         .filter(OrganizationMember.account_id == member.account_id)
         .filter(OrganizationMember.organization_id == member.organization_id)
-        .first()
+        .scalar()
     )
 
+    # the response is built before the commit, so it never depends on
+    # state the commit could expire
+    accepted_member = {
+        "email": member.account.email,
+        "role": role_name,
+        "organization": member.organization.name,
+        "is_accepted": True,
+    }
+
     # Accept invite
     try:
         member.is_accepted = True
@@ -646,17 +697,13 @@ def accept_invite(db: Session, invite_token: str) -> Dict[str, Any]:
         member.updated_at = datetime.utcnow()
         db.commit()
     except Exception as exc:
+        db.rollback()
         raise CustomException(
             status_code=500,
             message="Failed to accept invite",
         ) from exc
 
-    return {
-        "email": member.account.email,
-        "role": role.role.name,
-        "organization": member.organization.name,
-        "is_accepted": member.is_accepted,
-    }
+    return accepted_member
 
 
 def suspend_member(
@@ -682,34 +729,43 @@ def suspend_member(
     Returns:
         dict: Member details
     """
-    # Check if organization exists
-    organization = (
-        db.query(Organization)
-        .filter(Organization.id == organization_id)
-        .first()
-    )
-    if not organization:
-        raise CustomException(
-            status_code=404,
-            message="Organization not found",
-            data={"organization_id": organization_id},
+    # the organization name and invite state come back with the member,
+    # the organization is only looked up on its own when the member is
+    # not found
+    member, organization_name, is_accepted = (
+        db.query(
+            OrganizationMember, Organization.name, InviteMember.is_accepted
+        )
+        .join(
+            Organization,
+            Organization.id == OrganizationMember.organization_id,
+        )
+        .outerjoin(
+            InviteMember,
+            and_(
+                InviteMember.organization_id
+                == OrganizationMember.organization_id,
+                InviteMember.account_id == OrganizationMember.account_id,
+            ),
         )
-
-    # Check if member exists
-    member = (
-        db.query(OrganizationMember)
         .filter(OrganizationMember.organization_id == organization_id)
         .filter(OrganizationMember.id == member_id)
+        .options(
+            joinedload(OrganizationMember.account),
+            joinedload(OrganizationMember.member_role).joinedload(
+                OrganizationRole.role
+            ),
+            lazyload(OrganizationMember.organization),
+        )
         .first()
-    )
-
-    invite_instance = (
-        db.query(InviteMember)
-        .filter(InviteMember.organization_id == organization_id)
-        .filter(InviteMember.account_id == member.account_id)
-        .first()
-    )
+    ) or (None, None, None)
     if not member:
+        if not organization_exists(db, organization_id):
+            raise CustomException(
+                status_code=404,
+                message="Organization not found",
+                data={"organization_id": organization_id},
+            )
         raise CustomException(
             status_code=404,
             message="Member not found",
@@ -717,7 +773,7 @@ def suspend_member(
         )
 
     # Check if member is accepted
-    if not invite_instance.is_accepted:
+    if not is_accepted:
         raise CustomException(
             status_code=400,
             message="Member has not accepted invite",
@@ -725,39 +781,36 @@ def suspend_member(
         )
 
     # Suspend member
+    # the response is built before the commit, so it never depends on
+    # state the commit could expire
+    is_suspended = not member.is_suspended
+    suspended_member = serialize_member(member, is_suspended=is_suspended)
     try:
-        member.is_suspended = not member.is_suspended
+        member.is_suspended = is_suspended
         db.commit()
 
         background_tasks.add_task(
             send_email_api,
             subject="Account Suspended"
-            if member.is_suspended
+            if is_suspended
             else "Account Unsuspended",
-            recipient_email=member.account.email,
+            recipient_email=suspended_member["email"],
             template="_event_member_suspend_unsuspend.html",
             kwargs={
                 "name": member.account.first_name,
-                "organization_name": organization.name,
-                "is_suspended": member.is_suspended,
+                "organization_name": organization_name,
+                "is_suspended": is_suspended,
             },
         )
     except Exception as exc:
+        db.rollback()
         raise CustomException(
             status_code=500,
             message="Failed to suspend member",
             data={"member_id": member_id},
         ) from exc
-    finally:
-        db.refresh(member)
 
-    return {
-        "id": member.id,
-        "name": f"{member.account.first_name} {member.account.last_name}",
-        "email": member.account.email,
-        "role": member.member_role.role.name,
-        "is_suspended": member.is_suspended,
-    }
+    return suspended_member
 
 
 def delete_organization(
@@ -775,8 +828,13 @@ def delete_organization(
     Returns:
         dict: Organization details
     """
-    organization: Organization = check_organization_exists(
-        db, organization_id=organization_id
+    # only the owner is loaded with the organization, the children that
+    # cascade in the database are not selected before the delete
+    organization: Organization = (
+        db.query(Organization)
+        .options(lazyload("*"), joinedload(Organization.account))
+        .filter(Organization.id == organization_id)
+        .first()
     )
     if not organization:
         raise CustomException(
@@ -785,62 +843,85 @@ def delete_organization(
             data={"organization_id": organization_id},
         )
 
+    account = organization.account
+    organization_name = organization.name
+
     db.delete(organization)
 
     db.commit()
 
-    if check_organization_exists(db, organization_id):
-        background_tasks.add_task(
-            send_email_api,
-            subject="Event deleted",
-            recipient_email=organization.account.email,
-            template="_event_deleted.html",
-            kwargs={
-                "name": organization.account.first_name,
-                "organization_name": organization.name,
-            },
-        )
-        return True
-    return False
+    background_tasks.add_task(
+        send_email_api,
+        subject="Event deleted",
+        recipient_email=account.email,
+        template="_event_deleted.html",
+        kwargs={
+            "name": account.first_name,
+            "organization_name": organization_name,
+        },
+    )
+    return True
+
+
+def serialize_member(
+    member: OrganizationMember, **fields: Any
+) -> Dict[str, Any]:
+    """Serialize an organization member with its account and role.
+
+    Args:
+        member (OrganizationMember): Member with its account and role loaded
+        fields (Any): Extra fields added to the member details
+
+    Returns:
+        dict: Member details
+    """
+    account = member.account
+    return {
+        "id": member.id,
+        "name": f"{account.first_name} {account.last_name or ''}",
+        "email": account.email,
+        "role": member.member_role.role.name,
+        **fields,
+    }
+
+
+def organization_exists(db: Session, organization_id: str) -> bool:
+    """Check if an organization exists without loading it."""
+    return db.query(
+        exists().where(Organization.id == organization_id)
+    ).scalar()
 
 
 def check_organization_exists(
     db: Session, name: str | None = None, organization_id: str | None = None
-) -> Organization:
-    """Check if an organization name exists."""
+) -> bool:
+    """Check if an organization with the id or name exists."""
     if organization_id:
-        return (
-            db.query(Organization)
-            .filter(Organization.id == organization_id)
-            .first()
-        )
-    return db.query(Organization).filter(Organization.name == name).first()
+        return organization_exists(db, organization_id)
+    return db.query(exists().where(Organization.name == name)).scalar()
 
 
 def check_organization_member_exists(
     organization_id: str, account_id: str, db: Session
-) -> Any:
+) -> bool:
     """Check if an organization member exists."""
-    return (
-        db.query(OrganizationMember)
-        .filter(
+    return db.query(
+        exists().where(
             OrganizationMember.organization_id == organization_id,
             OrganizationMember.account_id == account_id,
         )
-        .first()
-    )
+    ).scalar()
 
 
 def check_organization_member_is_admin(
     organization_id: str, account_id: str, db: Session
-) -> Any:
+) -> bool:
     """Check if an organization member is an admin."""
-    return (
-        db.query(OrganizationMember, Organization)
-        .filter(
+    return db.query(
+        exists().where(
             OrganizationMember.organization_id == organization_id,
             OrganizationMember.account_id == account_id,
+            Organization.id == OrganizationMember.organization_id,
             Organization.owner == account_id,
         )
-        .first()
-    )
+    ).scalar()
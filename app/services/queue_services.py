@@ -0,0 +1,81 @@
+"""This module is used to hand jobs over to the gearman service worker."""
+import json
+import logging
+from typing import Any, Dict, List
+
+from python3_gearman import GearmanClient
+from python3_gearman.errors import GearmanError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+G_CLIENT = GearmanClient([f"{settings.GEARMAN_HOST}:{settings.GEARMAN_PORT}"])
+
+
+class TaskQueue:
+    """This class is used to submit background jobs to the gearman server.
+
+    Jobs are submitted without waiting for them to complete, so the request
+    only pays for handing the job over and the worker does the slow part.
+    """
+
+    def __init__(self, client: GearmanClient = G_CLIENT):
+        """This function is used to initialize the TaskQueue class.
+
+        Args:
+            client: This is the gearman client the jobs are submitted with.
+        """
+        self.client = client
+
+    def enqueue(self, task: str, data: Dict[str, Any]) -> None:
+        """This function is used to submit a job to the gearman server.
+
+        Args:
+            task: This is the name of the task registered by the worker.
+            data: This is the json serializable payload of the job.
+        """
+        try:
+            self.client.submit_job(
+                task,
+                json.dumps(data),
+                background=True,
+                wait_until_complete=False,
+            )
+        except GearmanError:
+            logger.exception("Failed to submit %s job", task)
+
+    def enqueue_many(self, task: str, payloads: List[Dict[str, Any]]) -> None:
+        """This function is used to submit many jobs of a task at once.
+
+        The jobs are sent together and their acceptance is awaited in one
+        poll, instead of one round trip to the gearman server per job.
+
+        Args:
+            task: This is the name of the task registered by the worker.
+            payloads: These are the json serializable payloads of the jobs.
+        """
+        if not payloads:
+            return
+        try:
+            self.client.submit_multiple_jobs(
+                [
+                    {"task": task, "data": json.dumps(data)}
+                    for data in payloads
+                ],
+                background=True,
+                wait_until_complete=False,
+            )
+        except GearmanError:
+            logger.exception(
+                "Failed to submit %d %s jobs", len(payloads), task
+            )
+
+
+def get_task_queue() -> TaskQueue:
+    """This function is used to get the task queue as a dependency.
+
+    Returns:
+        TaskQueue: The task queue the services submit jobs to.
+    """
+    return TaskQueue()
@@ -121,7 +121,6 @@ class RoleService(BaseModel):  # type: ignore
 
         db.add(role_intance)
         db.commit()
-        db.refresh(role_intance)
 
         return role_intance
 
@@ -307,7 +306,6 @@ class RoleService(BaseModel):  # type: ignore
         )
         db.add(member)
         db.commit()
-        db.refresh(member)
 
 
 def create_default_roles(db: object = get_db_unyield) -> None:
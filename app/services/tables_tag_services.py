@@ -142,7 +142,6 @@ def add_organization_table(
         )
         db.add(table)
         db.commit()
-        db.refresh(table)
         return CustomResponse(
             data=TableResponse(
                 id=table.id,
@@ -190,8 +189,6 @@ def add_organization_tag(
         )
         db.add(tag)
         db.commit()
-        db.refresh(tag)
-        print(tag.id, tag.name, tag.description, tag.tag_type)
         return CustomResponse(
             data=TagResponse(
                 id=tag.id,
@@ -1,5 +1,8 @@
 """Test cases for custom responses and exceptions."""
+from datetime import datetime
+
 import pytest
+from pydantic import BaseModel
 
 from app.api.responses.custom_responses import (
     CustomException,
@@ -34,6 +37,30 @@ def test_custom_response_with_headers() -> None:
     assert response.headers.get("X-Custom") == "test"
 
 
+def test_custom_response_renders_datetimes_and_models() -> None:
+    """Test the custom response renders values jsonable_encoder would."""
+
+    class Tag(BaseModel):
+        """A model rendered through the jsonable_encoder fallback."""
+
+        name: str
+        created_at: datetime
+
+    created_at = datetime(2024, 1, 2, 3, 4, 5)
+    response = CustomResponse(
+        status_code=200,
+        message="Success",
+        data={
+            "created_at": created_at,
+            "tags": [Tag(name="vegan", created_at=created_at)],
+        },
+    )
+    assert response.body == (
+        b'{"message":"Success","data":{"created_at":"2024-01-02T03:04:05",'
+        b'"tags":[{"name":"vegan","created_at":"2024-01-02T03:04:05"}]}}'
+    )
+
+
 def test_custom_exception() -> None:
     """Test the custom exception class."""
     with pytest.raises(CustomException) as exc:
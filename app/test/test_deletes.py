@@ -0,0 +1,128 @@
+# pylint: disable=redefined-outer-name
+"""Test that deletes leave no rows pointing at what they removed.
+
+The in memory database enforces foreign keys, so a delete that leaves a
+row referencing a deleted one fails like it does on PostgreSQL.
+"""
+from typing import Any
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.models import *  # noqa: F401, F403 pylint: disable=W0401
+from app.api.models.account_models import Account
+from app.api.models.guest_models import Guest
+from app.api.models.meal_models import Meal, MealCategory
+from app.api.models.organization_models import Organization
+from app.database.connection import Base
+from app.services.meal_services import delete_meal_service
+from app.services.organization_services import delete_organization
+
+ORGANIZATION_ID = "5b0c1d9a4e2f4c4f9d3a7e6b8c1f2a3d"
+ACCOUNT_ID = "8e3f2a1b0c9d4e5f8a7b6c5d4e3f2a1b"
+
+
+@pytest.fixture()
+def db() -> Any:
+    """Create a session on an in memory database enforcing foreign keys."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def enforce_foreign_keys(dbapi_connection, connection_record):
+        # pylint: disable=unused-argument
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(bind=engine)
+    testing_session_local = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+    )
+    session = testing_session_local()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def seed_guest_with_meal(db: Any) -> None:
+    """Add an organization with a guest who chose a meal."""
+    db.add(
+        Account(
+            id=ACCOUNT_ID,
+            first_name="John",
+            last_name="Doe",
+            email="test@email.com",
+            password_hash="password",
+        )
+    )
+    db.add(
+        Organization(
+            id=ORGANIZATION_ID,
+            name="Test Organization",
+            owner=ACCOUNT_ID,
+            org_type="Wedding",
+        )
+    )
+    db.add(
+        MealCategory(
+            id="meal_category",
+            name="Mains",
+            organization_id=ORGANIZATION_ID,
+        )
+    )
+    db.add(
+        Meal(
+            id="meal",
+            name="Rice",
+            description="Rice",
+            image_url="image_url",
+            quantity=1,
+            meal_category_id="meal_category",
+            organization_id=ORGANIZATION_ID,
+        )
+    )
+    db.add(
+        Guest(
+            id="guest",
+            first_name="John",
+            last_name="Doe",
+            email="guest@email.com",
+            organization_id=ORGANIZATION_ID,
+            meal_id="meal",
+        )
+    )
+    db.commit()
+    db.expunge_all()
+
+
+def test_delete_meal_clears_the_meal_of_its_guests(db: Any) -> None:
+    """Deleting a meal a guest chose leaves the guest without a meal."""
+    seed_guest_with_meal(db)
+
+    assert delete_meal_service("meal", db) is True
+
+    assert db.get(Meal, "meal") is None
+    assert db.get(Guest, "guest").meal_id is None
+
+
+def test_delete_organization_with_a_guest_who_chose_a_meal(db: Any) -> None:
+    """Deleting an organization clears the meal its guest chose."""
+    seed_guest_with_meal(db)
+
+    assert delete_organization(db, ORGANIZATION_ID, BackgroundTasks()) is True
+
+    db.expunge_all()
+    assert db.get(Organization, ORGANIZATION_ID) is None
+    assert db.get(Meal, "meal") is None
+    guest = db.get(Guest, "guest")
+    assert guest.meal_id is None
+    assert guest.organization_id is None
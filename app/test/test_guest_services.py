@@ -0,0 +1,337 @@
+# pylint: disable=redefined-outer-name
+"""Test how the guest services create guests and queue their invites.
+
+The in memory database enforces foreign keys, so an insert referencing a
+missing row fails like it does on PostgreSQL.
+"""
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.middlewares.authorization import is_org_authorized
+from app.api.models import *  # noqa: F401, F403 pylint: disable=W0401
+from app.api.models.account_models import Account
+from app.api.models.guest_models import Guest, GuestTags
+from app.api.models.organization_models import Organization, OrganizationTag
+from app.api.responses.custom_responses import CustomException
+from app.api.routers.organization_guest_router import router
+from app.api.schemas.guest_schemas import AddGuest, GuestAssignedTable
+from app.database.connection import Base, get_db
+from app.services.guest_services import add_guest, bulk_add_guests
+from app.services.queue_services import get_task_queue
+
+ORGANIZATION_ID = "5b0c1d9a4e2f4c4f9d3a7e6b8c1f2a3d"
+ACCOUNT_ID = "8e3f2a1b0c9d4e5f8a7b6c5d4e3f2a1b"
+TAG_ID = "0f1e2d3c4b5a49687f6e5d4c3b2a1908"
+MISSING_TAG_ID = "9a8b7c6d5e4f43218a9b8c7d6e5f4a3b"
+
+
+class FakeTaskQueue:
+    """Record the jobs a service submits instead of sending them."""
+
+    def __init__(self):
+        self.jobs: List[Tuple[str, Dict[str, Any]]] = []
+        self.submissions = 0
+
+    def enqueue(self, task: str, data: Dict[str, Any]) -> None:
+        """Record one job."""
+        self.jobs.append((task, data))
+        self.submissions += 1
+
+    def enqueue_many(self, task: str, payloads: List[Dict[str, Any]]) -> None:
+        """Record the jobs submitted together."""
+        self.jobs.extend((task, data) for data in payloads)
+        self.submissions += 1
+
+
+@pytest.fixture()
+def db() -> Any:
+    """Create a session on an in memory database enforcing foreign keys."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def enforce_foreign_keys(dbapi_connection, connection_record):
+        # pylint: disable=unused-argument
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(bind=engine)
+    testing_session_local = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+    )
+    session = testing_session_local()
+    try:
+        seed_organization(session)
+        yield session
+    finally:
+        session.close()
+
+
+def seed_organization(db: Any) -> None:
+    """Add an organization and its owner."""
+    db.add(
+        Account(
+            id=ACCOUNT_ID,
+            first_name="John",
+            last_name="Doe",
+            email="test@email.com",
+            password_hash="password",
+        )
+    )
+    db.add(
+        Organization(
+            id=ORGANIZATION_ID,
+            name="Test Organization",
+            owner=ACCOUNT_ID,
+            org_type="Wedding",
+        )
+    )
+    db.add(
+        OrganizationTag(
+            id=TAG_ID,
+            name="family",
+            tag_type="guest",
+            organization_id=ORGANIZATION_ID,
+        )
+    )
+    db.commit()
+
+
+def test_add_guest_with_a_taken_email_is_a_conflict(db: Any) -> None:
+    """A second guest with the same email is rejected with a 409."""
+    task_queue = FakeTaskQueue()
+    guest = AddGuest(first_name="John", email="guest@email.com")
+    add_guest(guest, ORGANIZATION_ID, db, task_queue)
+
+    with pytest.raises(CustomException) as error:
+        add_guest(guest, ORGANIZATION_ID, db, task_queue)
+
+    assert error.value.status_code == 409
+    assert db.query(Guest).count() == 1
+
+
+def test_add_guest_with_an_unknown_table_group_is_not_a_conflict(
+    db: Any,
+) -> None:
+    """A guest seated at a missing table group is not reported as taken."""
+    guest = AddGuest(
+        first_name="John",
+        email="guest@email.com",
+        table_group=GuestAssignedTable(table_group_id="missing"),
+    )
+
+    with pytest.raises(IntegrityError):
+        add_guest(guest, ORGANIZATION_ID, db, FakeTaskQueue())
+
+    assert db.query(Guest).count() == 0
+
+
+def test_add_guest_queues_the_invite_with_its_code(db: Any) -> None:
+    """The invite queued after the commit carries the stored invite code."""
+    task_queue = FakeTaskQueue()
+    guest = AddGuest(first_name="John", email="guest@email.com")
+
+    add_guest(guest, ORGANIZATION_ID, db, task_queue)
+
+    invite_code = db.query(Guest.invite_code).scalar()
+    assert invite_code.startswith("Tes")
+    assert len(invite_code) == 10
+    assert task_queue.jobs == [
+        (
+            "guest_invites",
+            {
+                "email": "guest@email.com",
+                "first_name": "John",
+                "invite_code": invite_code,
+            },
+        )
+    ]
+
+
+def test_add_guest_queues_nothing_when_the_insert_fails(db: Any) -> None:
+    """No invite is queued for a guest that was not created."""
+    guest = AddGuest(first_name="John", email="guest@email.com")
+    add_guest(guest, ORGANIZATION_ID, db, FakeTaskQueue())
+    task_queue = FakeTaskQueue()
+
+    with pytest.raises(CustomException):
+        add_guest(guest, ORGANIZATION_ID, db, task_queue)
+
+    assert task_queue.jobs == []
+
+
+def test_bulk_add_guests_skips_repeated_and_taken_emails(db: Any) -> None:
+    """Emails repeated in the request or already taken are skipped."""
+    add_guest(
+        AddGuest(first_name="John", email="taken@email.com"),
+        ORGANIZATION_ID,
+        db,
+        FakeTaskQueue(),
+    )
+    task_queue = FakeTaskQueue()
+
+    response = bulk_add_guests(
+        [
+            AddGuest(first_name="Jane", email="guest@email.com"),
+            AddGuest(first_name="Jack", email="guest@email.com"),
+            AddGuest(first_name="Jill", email="taken@email.com"),
+        ],
+        ORGANIZATION_ID,
+        db,
+        task_queue,
+    )
+
+    assert json.loads(response.body)["data"] == {
+        "created": 1,
+        "skipped": ["guest@email.com", "taken@email.com"],
+    }
+    assert db.query(Guest).filter(Guest.first_name == "Jack").count() == 0
+    assert db.query(Guest).filter(Guest.first_name == "Jill").count() == 0
+    assert [data["first_name"] for _, data in task_queue.jobs] == ["Jane"]
+
+
+def test_bulk_add_guests_drops_unknown_tags(db: Any) -> None:
+    """Only the tags of the organization that exist are added."""
+    bulk_add_guests(
+        [
+            AddGuest(
+                first_name="Jane",
+                email="guest@email.com",
+                tags=[TAG_ID, MISSING_TAG_ID, TAG_ID],
+            )
+        ],
+        ORGANIZATION_ID,
+        db,
+        FakeTaskQueue(),
+    )
+
+    assert [tag.tag_id for tag in db.query(GuestTags)] == [TAG_ID]
+
+
+def test_bulk_add_guests_inserts_in_chunks(db: Any) -> None:
+    """Past a chunk of rows the guests are inserted in several batches."""
+    inserts: List[int] = []
+
+    def count_guest_inserts(
+        conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument
+        if statement.startswith("INSERT INTO guest "):
+            inserts.append(len(parameters) if executemany else 1)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", count_guest_inserts)
+    task_queue = FakeTaskQueue()
+    try:
+        bulk_add_guests(
+            [
+                AddGuest(first_name="Jane", email=f"guest{i}@email.com")
+                for i in range(1001)
+            ],
+            ORGANIZATION_ID,
+            db,
+            task_queue,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_guest_inserts)
+
+    assert inserts == [1000, 1]
+    assert db.query(Guest).count() == 1001
+    assert len(task_queue.jobs) == 1001
+    assert task_queue.submissions == 1
+
+
+def test_bulk_add_guests_reports_an_email_taken_meanwhile(db: Any) -> None:
+    """An email taken after the lookup is a conflict, nothing is queued."""
+    taken: List[str] = []
+
+    def take_email(
+        conn, cursor, statement, parameters, context, executemany
+    ):  # pylint: disable=unused-argument
+        if statement.startswith("INSERT INTO guest ") and not taken:
+            taken.append("guest@email.com")
+            cursor.execute(
+                "INSERT INTO guest (id, first_name, last_name, email) "
+                "VALUES ('other', 'John', '', 'guest@email.com')"
+            )
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", take_email)
+    task_queue = FakeTaskQueue()
+
+    with pytest.raises(CustomException) as error:
+        bulk_add_guests(
+            [AddGuest(first_name="Jane", email="guest@email.com")],
+            ORGANIZATION_ID,
+            db,
+            task_queue,
+        )
+
+    event.remove(engine, "before_cursor_execute", take_email)
+    assert error.value.status_code == 409
+    assert task_queue.jobs == []
+
+
+def test_bulk_add_guests_raises_other_integrity_errors(db: Any) -> None:
+    """A guest seated at a missing table group is not reported as taken."""
+    task_queue = FakeTaskQueue()
+
+    with pytest.raises(IntegrityError):
+        bulk_add_guests(
+            [
+                AddGuest(
+                    first_name="Jane",
+                    email="guest@email.com",
+                    table_group=GuestAssignedTable(table_group_id="missing"),
+                )
+            ],
+            ORGANIZATION_ID,
+            db,
+            task_queue,
+        )
+
+    assert db.query(Guest).count() == 0
+    assert task_queue.jobs == []
+
+
+def test_bulk_create_route_creates_the_guests(db: Any) -> None:
+    """The route creates the guests of the member's organization."""
+    task_queue = FakeTaskQueue()
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_task_queue] = lambda: task_queue
+    app.dependency_overrides[is_org_authorized] = lambda: SimpleNamespace(
+        member=SimpleNamespace(organization_id=ORGANIZATION_ID)
+    )
+
+    response = TestClient(app).post(
+        "/guests/bulk-create",
+        json=[
+            {"first_name": "Jane", "email": "jane@email.com"},
+            {"first_name": "Jack", "email": "jack@email.com"},
+        ],
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"] == {"created": 2, "skipped": []}
+    assert (
+        db.query(Guest)
+        .filter(Guest.organization_id == ORGANIZATION_ID)
+        .count()
+        == 2
+    )
+    assert len(task_queue.jobs) == 2
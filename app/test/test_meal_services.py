@@ -0,0 +1,129 @@
+# pylint: disable=redefined-outer-name
+"""Test how meals are tagged.
+
+The in memory database enforces foreign keys, so an insert referencing a
+missing row fails like it does on PostgreSQL.
+"""
+from typing import Any
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.models import *  # noqa: F401, F403 pylint: disable=W0401
+from app.api.models.account_models import Account
+from app.api.models.meal_models import Meal, MealCategory, MealTag
+from app.api.models.organization_models import Organization
+from app.api.responses.custom_responses import CustomException
+from app.database.connection import Base
+from app.services.meal_services import create_meal_tag
+
+ORGANIZATION_ID = "5b0c1d9a4e2f4c4f9d3a7e6b8c1f2a3d"
+OTHER_ORGANIZATION_ID = "7d6c5b4a3f2e41d0c9b8a7f6e5d4c3b2"
+ACCOUNT_ID = "8e3f2a1b0c9d4e5f8a7b6c5d4e3f2a1b"
+
+
+@pytest.fixture()
+def db() -> Any:
+    """Create a session on an in memory database enforcing foreign keys."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def enforce_foreign_keys(dbapi_connection, connection_record):
+        # pylint: disable=unused-argument
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(bind=engine)
+    testing_session_local = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+    )
+    session = testing_session_local()
+    try:
+        seed_meal(session)
+        yield session
+    finally:
+        session.close()
+
+
+def seed_meal(db: Any) -> None:
+    """Add a meal of one organization and a second organization."""
+    db.add(
+        Account(
+            id=ACCOUNT_ID,
+            first_name="John",
+            last_name="Doe",
+            email="test@email.com",
+            password_hash="password",
+        )
+    )
+    for organization_id in (ORGANIZATION_ID, OTHER_ORGANIZATION_ID):
+        db.add(
+            Organization(
+                id=organization_id,
+                name="Test Organization",
+                owner=ACCOUNT_ID,
+                org_type="Wedding",
+            )
+        )
+    db.add(
+        MealCategory(
+            id="meal_category",
+            name="Mains",
+            organization_id=ORGANIZATION_ID,
+        )
+    )
+    db.add(
+        Meal(
+            id="meal",
+            name="Rice",
+            description="Rice",
+            image_url="image_url",
+            quantity=1,
+            meal_category_id="meal_category",
+            organization_id=ORGANIZATION_ID,
+        )
+    )
+    db.commit()
+
+
+def test_create_meal_tag_adds_the_tag(db: Any) -> None:
+    """A meal is tagged with a new organization tag of the name."""
+    meal_tag = create_meal_tag(ORGANIZATION_ID, "meal", "Vegan", db)
+
+    assert meal_tag.name == "vegan"
+    assert meal_tag.meal_id == "meal"
+    assert db.query(MealTag).count() == 1
+
+
+def test_create_meal_tag_twice_is_a_conflict(db: Any) -> None:
+    """The same tag is added to a meal only once."""
+    create_meal_tag(ORGANIZATION_ID, "meal", "vegan", db)
+
+    with pytest.raises(CustomException) as error:
+        create_meal_tag(ORGANIZATION_ID, "meal", "vegan", db)
+
+    assert error.value.status_code == 409
+    assert db.query(MealTag).count() == 1
+
+
+@pytest.mark.parametrize(
+    "organization_id, meal_id",
+    [(ORGANIZATION_ID, "missing"), (OTHER_ORGANIZATION_ID, "meal")],
+)
+def test_create_meal_tag_for_an_unknown_meal_is_not_found(
+    db: Any, organization_id: str, meal_id: str
+) -> None:
+    """A meal that is missing or of another organization is not tagged."""
+    with pytest.raises(CustomException) as error:
+        create_meal_tag(organization_id, meal_id, "vegan", db)
+
+    assert error.value.status_code == 404
+    assert db.query(MealTag).count() == 0
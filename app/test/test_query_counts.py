@@ -0,0 +1,503 @@
+# pylint: disable=redefined-outer-name
+"""Test that the guest, invite and meal services do not lazy load per row.
+
+Set PYTEST_ENFORCE_EAGER=1 to make every relationship that a top level
+query does not load explicitly raise when it is accessed.
+"""
+import os
+from contextlib import contextmanager
+from typing import Any, Iterator, List
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import raiseload, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.models import *  # noqa: F401, F403 pylint: disable=W0401
+from app.api.models.account_models import Account
+from app.api.models.guest_models import Guest, GuestTags
+from app.api.models.meal_models import Meal, MealCategory, MealTag
+from app.api.models.organization_models import (
+    InviteMember,
+    Organization,
+    OrganizationDetail,
+    OrganizationMember,
+    OrganizationRole,
+    OrganizationTag,
+)
+from app.api.models.role_models import Role
+from app.api.schemas.meal_schema import MealCategorySchema
+from app.database.connection import Base
+from app.services import meal_services
+from app.services.guest_services import (
+    fetch_all_guests,
+    search_organization_guests,
+)
+from app.services.meal_services import (
+    create_mc_service,
+    fetch_meal_tag_by_id,
+    get_all_meal_tag_service,
+    get_meal_categories,
+    get_meal_service,
+)
+from app.services.organization_services import (
+    accept_invite,
+    get_all_organizations,
+    get_members,
+    suspend_member,
+)
+
+ENFORCE_EAGER = os.environ.get("PYTEST_ENFORCE_EAGER") == "1"
+
+ORGANIZATION_ID = "5b0c1d9a4e2f4c4f9d3a7e6b8c1f2a3d"
+ACCOUNT_ID = "8e3f2a1b0c9d4e5f8a7b6c5d4e3f2a1b"
+INVITE_TOKEN = "invite-token"
+
+
+@contextmanager
+def count_queries(engine: Any) -> Iterator[List[str]]:
+    """Collect the statements executed on the engine."""
+    queries: List[str] = []
+
+    def before_cursor_execute(
+        conn, cursor, statement, *args
+    ):  # pylint: disable=unused-argument
+        queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture()
+def engine() -> Any:
+    """Create an in memory database."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture()
+def db(engine: Any) -> Any:
+    """Create a session, raising on lazy loads if enforced."""
+    testing_session_local = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+    )
+    session = testing_session_local()
+
+    if ENFORCE_EAGER:
+
+        @event.listens_for(session, "do_orm_execute")
+        def enforce_eager(orm_execute_state):
+            if (
+                orm_execute_state.is_select
+                and not orm_execute_state.is_relationship_load
+                and not orm_execute_state.is_column_load
+            ):
+                orm_execute_state.statement = (
+                    orm_execute_state.statement.options(raiseload("*"))
+                )
+
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def seed_guests(db: Any, count: int) -> None:
+    """Add an organization with tagged guests."""
+    db.add(
+        Organization(
+            id=ORGANIZATION_ID,
+            name="Test Organization",
+            owner=ACCOUNT_ID,
+            org_type="Wedding",
+        )
+    )
+    for i in range(count):
+        tag_id = f"{i:032x}"
+        db.add(
+            OrganizationTag(
+                id=tag_id,
+                organization_id=ORGANIZATION_ID,
+                name=f"Tag {i}",
+                tag_type="guest",
+            )
+        )
+        db.add(
+            Guest(
+                id=f"guest{i}",
+                first_name="John",
+                last_name=f"Doe {i}",
+                email=f"guest{i}@email.com",
+                organization_id=ORGANIZATION_ID,
+            )
+        )
+        db.add(GuestTags(id=f"tag{i}", guest_id=f"guest{i}", tag_id=tag_id))
+    db.commit()
+    db.expunge_all()
+
+
+@pytest.mark.parametrize("count", [1, 25])
+def test_fetch_all_guests_query_count(
+    engine: Any, db: Any, count: int
+) -> None:
+    """The number of queries does not grow with the number of guests."""
+    seed_guests(db, count)
+
+    with count_queries(engine) as queries:
+        response = fetch_all_guests(db, ORGANIZATION_ID)
+
+    assert response.status_code == 200
+    assert len(queries) <= 3
+
+
+@pytest.mark.parametrize("count", [1, 25])
+def test_search_organization_guests_query_count(
+    engine: Any, db: Any, count: int
+) -> None:
+    """The number of queries does not grow with the number of guests."""
+    seed_guests(db, count)
+
+    with count_queries(engine) as queries:
+        response = search_organization_guests(db, ORGANIZATION_ID, name="Doe")
+
+    assert response.status_code == 200
+    assert len(queries) <= 3
+
+
+def test_accept_invite_query_count(engine: Any, db: Any) -> None:
+    """Accepting an invite loads what it renders up front."""
+    db.add(
+        Account(
+            id=ACCOUNT_ID,
+            first_name="John",
+            last_name="Doe",
+            email="test@email.com",
+            password_hash="password",
+        )
+    )
+    db.add(Role(id="role", name="Admin", description="Admin role"))
+    seed_guests(db, 0)
+    db.add(
+        OrganizationRole(
+            id="organization_role",
+            organization_id=ORGANIZATION_ID,
+            role_id="role",
+        )
+    )
+    db.add(
+        OrganizationMember(
+            id="member",
+            organization_id=ORGANIZATION_ID,
+            account_id=ACCOUNT_ID,
+            organization_role_id="organization_role",
+        )
+    )
+    db.add(
+        InviteMember(
+            id="invite",
+            organization_id=ORGANIZATION_ID,
+            account_id=ACCOUNT_ID,
+            invite_token=INVITE_TOKEN,
+        )
+    )
+    db.commit()
+    db.expunge_all()
+
+    with count_queries(engine) as queries:
+        member = accept_invite(db, INVITE_TOKEN)
+
+    assert member == {
+        "email": "test@email.com",
+        "role": "Admin",
+        "organization": "Test Organization",
+        "is_accepted": True,
+    }
+    # invite, role, update
+    assert len(queries) <= 3
+
+
+@pytest.mark.parametrize("count", [1, 25])
+def test_get_members_query_count(engine: Any, db: Any, count: int) -> None:
+    """The number of queries does not grow with the number of members."""
+    db.add(Role(id="role", name="Admin", description="Admin role"))
+    seed_guests(db, 0)
+    db.add(
+        OrganizationRole(
+            id="organization_role",
+            organization_id=ORGANIZATION_ID,
+            role_id="role",
+        )
+    )
+    for i in range(count):
+        db.add(
+            Account(
+                id=f"account{i}",
+                first_name="John",
+                last_name=f"Doe {i}",
+                email=f"member{i}@email.com",
+                password_hash="password",
+            )
+        )
+        db.add(
+            InviteMember(
+                id=f"invite{i}",
+                organization_id=ORGANIZATION_ID,
+                account_id=f"account{i}",
+                invite_token=f"token{i}",
+                is_accepted=True,
+            )
+        )
+        db.add(
+            OrganizationMember(
+                id=f"member{i}",
+                organization_id=ORGANIZATION_ID,
+                account_id=f"account{i}",
+                organization_role_id="organization_role",
+            )
+        )
+    db.commit()
+    db.expunge_all()
+
+    with count_queries(engine) as queries:
+        members = get_members(db, ORGANIZATION_ID)
+
+    assert len(members["members"]) == count
+    assert members["members"][0]["role"] == "Admin"
+    # members, the organization is only checked when there are none
+    assert len(queries) <= 1
+
+
+@pytest.mark.parametrize("count", [1, 25])
+def test_get_all_organizations_query_count(
+    engine: Any, db: Any, count: int
+) -> None:
+    """The number of queries does not grow with the number of members."""
+    db.add(Role(id="role", name="Admin", description="Admin role"))
+    for i in range(count):
+        db.add(
+            Organization(
+                id=f"organization{i}",
+                name=f"Organization {i}",
+                owner=ACCOUNT_ID,
+                org_type="Wedding",
+            )
+        )
+        db.add(
+            OrganizationDetail(
+                organization_id=f"organization{i}", website="website"
+            )
+        )
+        db.add(
+            OrganizationRole(
+                id=f"organization_role{i}",
+                organization_id=f"organization{i}",
+                role_id="role",
+            )
+        )
+        db.add(
+            OrganizationMember(
+                id=f"member{i}",
+                organization_id=f"organization{i}",
+                account_id=ACCOUNT_ID,
+                organization_role_id=f"organization_role{i}",
+            )
+        )
+    db.commit()
+    db.expunge_all()
+
+    with count_queries(engine) as queries:
+        organizations = get_all_organizations(ACCOUNT_ID, db)
+
+    assert len(organizations) == count
+    assert organizations[0]["event_details"]["website"] == "website"
+    assert len(queries) == 1
+
+
+def test_suspend_member_query_count(engine: Any, db: Any) -> None:
+    """Suspending a member reads it once and writes it once."""
+    db.add(
+        Account(
+            id=ACCOUNT_ID,
+            first_name="John",
+            last_name="Doe",
+            email="test@email.com",
+            password_hash="password",
+        )
+    )
+    db.add(Role(id="role", name="Admin", description="Admin role"))
+    seed_guests(db, 0)
+    db.add(
+        OrganizationRole(
+            id="organization_role",
+            organization_id=ORGANIZATION_ID,
+            role_id="role",
+        )
+    )
+    db.add(
+        OrganizationMember(
+            id="member",
+            organization_id=ORGANIZATION_ID,
+            account_id=ACCOUNT_ID,
+            organization_role_id="organization_role",
+        )
+    )
+    db.add(
+        InviteMember(
+            id="invite",
+            organization_id=ORGANIZATION_ID,
+            account_id=ACCOUNT_ID,
+            invite_token=INVITE_TOKEN,
+            is_accepted=True,
+        )
+    )
+    db.commit()
+    db.expunge_all()
+
+    with count_queries(engine) as queries:
+        member = suspend_member(
+            db, ORGANIZATION_ID, "member", BackgroundTasks()
+        )
+
+    assert member["is_suspended"] is True
+    assert member["role"] == "Admin"
+    # member with organization name and invite state, update
+    assert len(queries) <= 2
+
+
+def seed_meal_tags(db: Any, count: int) -> None:
+    """Add a meal tagged with the organization tags of the guests."""
+    seed_guests(db, count)
+    db.add(
+        MealCategory(
+            id="meal_category",
+            name="Mains",
+            organization_id=ORGANIZATION_ID,
+        )
+    )
+    db.add(
+        Meal(
+            id="meal",
+            name="Rice",
+            description="Rice",
+            image_url="image_url",
+            quantity=1,
+            meal_category_id="meal_category",
+            organization_id=ORGANIZATION_ID,
+        )
+    )
+    for i in range(count):
+        db.add(
+            MealTag(
+                id=f"meal_tag{i}",
+                organization_tag_id=f"{i:032x}",
+                meal_id="meal",
+            )
+        )
+    db.commit()
+    db.expunge_all()
+
+
+@pytest.mark.parametrize("count", [1, 25])
+def test_get_all_meal_tag_service_query_count(
+    engine: Any, db: Any, count: int
+) -> None:
+    """The number of queries does not grow with the number of meal tags."""
+    seed_meal_tags(db, count)
+
+    with count_queries(engine) as queries:
+        tags = get_all_meal_tag_service("meal", db)
+
+    assert tags["total"] == count
+    assert tags["tags"][0].name == "Tag 0"
+    # meal, tags with their organization tags
+    assert len(queries) <= 2
+
+
+@pytest.mark.parametrize("count", [1, 25])
+def test_get_meal_service_with_tags_query_count(
+    engine: Any, db: Any, count: int
+) -> None:
+    """The number of queries does not grow with the number of meals."""
+    seed_meal_tags(db, count)
+    for i in range(1, count):
+        db.add(
+            Meal(
+                id=f"meal{i}",
+                name="Rice",
+                description="Rice",
+                image_url="image_url",
+                quantity=1,
+                meal_category_id="meal_category",
+                organization_id=ORGANIZATION_ID,
+            )
+        )
+        db.add(
+            MealTag(
+                id=f"other_meal_tag{i}",
+                organization_tag_id=f"{i:032x}",
+                meal_id=f"meal{i}",
+            )
+        )
+    db.commit()
+    db.expunge_all()
+
+    with count_queries(engine) as queries:
+        meals = get_meal_service(
+            offset=0,
+            limit=100,
+            order="asc",
+            db=db,
+            sort_by="organization",
+            organization_id=ORGANIZATION_ID,
+            include_tags=True,
+        )
+
+    assert meals["total"] == count
+    assert all(meal["tags"] for meal in meals["Meals"])
+    # count, meals, tags of the meals
+    assert len(queries) <= 3
+
+
+def test_fetch_meal_tag_by_id_query_count(engine: Any, db: Any) -> None:
+    """A meal tag is read together with the name of its organization tag."""
+    seed_meal_tags(db, 1)
+
+    with count_queries(engine) as queries:
+        name, meal_tag = fetch_meal_tag_by_id("meal_tag0", db)
+
+    assert name == "Tag 0"
+    assert meal_tag.id == "meal_tag0"
+    assert len(queries) == 1
+
+
+def test_get_meal_categories_is_cached_until_a_write(
+    engine: Any, db: Any, monkeypatch: Any
+) -> None:
+    """The category listing is served from the cache until it changes."""
+    monkeypatch.setattr(meal_services, "_MEAL_CATEGORY_CACHE", {})
+    seed_guests(db, 0)
+    create_mc_service(ORGANIZATION_ID, MealCategorySchema(name="Mains"), db)
+
+    with count_queries(engine) as queries:
+        first = get_meal_categories(ORGANIZATION_ID, db)
+        second = get_meal_categories(ORGANIZATION_ID, db)
+
+    assert first == second
+    # organization, categories, the second listing is cached
+    assert len(queries) <= 2
+
+    create_mc_service(ORGANIZATION_ID, MealCategorySchema(name="Sides"), db)
+
+    assert len(get_meal_categories(ORGANIZATION_ID, db)) == 2
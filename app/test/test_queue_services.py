@@ -0,0 +1,45 @@
+"""Test how the task queue hands jobs over to the gearman client."""
+import json
+from unittest.mock import MagicMock
+
+from python3_gearman.errors import GearmanError
+
+from app.services.queue_services import TaskQueue
+
+
+def test_enqueue_many_submits_the_jobs_together() -> None:
+    """Every payload is sent in one submission without waiting for it."""
+    client = MagicMock()
+
+    TaskQueue(client).enqueue_many("guest_invites", [{"a": 1}, {"a": 2}])
+
+    client.submit_multiple_jobs.assert_called_once_with(
+        [
+            {"task": "guest_invites", "data": json.dumps({"a": 1})},
+            {"task": "guest_invites", "data": json.dumps({"a": 2})},
+        ],
+        background=True,
+        wait_until_complete=False,
+    )
+    client.submit_job.assert_not_called()
+
+
+def test_enqueue_many_skips_an_empty_batch() -> None:
+    """Nothing is sent when there are no payloads."""
+    client = MagicMock()
+
+    TaskQueue(client).enqueue_many("guest_invites", [])
+
+    client.submit_multiple_jobs.assert_not_called()
+
+
+def test_enqueue_many_logs_a_failed_submission_once(caplog) -> None:
+    """A server that is down is logged once for the whole batch."""
+    client = MagicMock()
+    client.submit_multiple_jobs.side_effect = GearmanError("down")
+
+    TaskQueue(client).enqueue_many("guest_invites", [{"a": 1}, {"a": 2}])
+
+    assert [record.message for record in caplog.records] == [
+        "Failed to submit 2 guest_invites jobs"
+    ]
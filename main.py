@@ -1,5 +1,9 @@
 """Main module for the API."""
 
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
 import sentry_sdk
 import uvicorn
 from fastapi import APIRouter, FastAPI, HTTPException
@@ -45,6 +49,25 @@ sentry_sdk.init(
 
 # ================================================ #
 
+# ============ Logging Initialization ============ #
+
+# the app loggers only put records on a queue, a listener thread writes
+# them out so a burst of failures does not block requests on stderr.
+# Records do not propagate, so no root handler writes them on the request
+# thread as well.
+log_queue: SimpleQueue = SimpleQueue()
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s")
+)
+log_listener = QueueListener(log_queue, log_handler)
+app_logger = logging.getLogger("app")
+app_logger.setLevel(logging.INFO)
+app_logger.propagate = False
+app_logger.addHandler(QueueHandler(log_queue))
+
+# ================================================ #
+
 v1_router = APIRouter(prefix="/api/v1")
 
 
@@ -118,12 +141,23 @@ def health() -> CustomResponse:
 @app.on_event("startup")
 async def startup_event():
     """Create default roles on startup."""
+    log_listener.start()
 
     if settings.ENVIRONMENT == "production":
         db = get_db_unyield()
-        ORG_ADMIN_PERMISSION.create_permissions(db)
-        create_default_roles(db)
-        # Plan.create_default_plans(db)
+        # hand the connection back to the pool once the defaults exist
+        try:
+            ORG_ADMIN_PERMISSION.create_permissions(db)
+            create_default_roles(db)
+            # Plan.create_default_plans(db)
+        finally:
+            db.close()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Write out the queued log records on shutdown."""
+    log_listener.stop()
 
 
 app.include_router(v1_router)
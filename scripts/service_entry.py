@@ -260,7 +260,7 @@ def process_start(import_id: str):
             print("guest instance created")
             print("adding guest tags...")
 
-            for tag in tags:
+            for tag in dict.fromkeys(tags):
                 guest_tags = GuestTags(
                     id=uuid4().hex, guest_id=guest_id, tag_id=tag
                 )
@@ -5,6 +5,7 @@ import json
 from python3_gearman import GearmanWorker
 
 from app.core.config import settings
+from app.services.email_services import send_email_api
 from scripts.service_entry import process_start
 
 # Initialize gearman worker
@@ -31,8 +32,37 @@ def import_task_listener(task_id: str, gearman_job: str):
     return "success"
 
 
+def guest_invite_listener(task_id: str, gearman_job: str):
+    """This function listens for guest invites from the gearman server and
+    emails them.
+
+    Args:
+        task_id (str): The task id
+        gearman_job (str): The gearman job
+
+    Returns:
+        str: The status of the task
+    """
+    print(task_id)
+    guest = json.loads(gearman_job.data)
+
+    send_email_api(
+        subject="You are invited",
+        recipient_email=guest["email"],
+        template="_email_guest_invitation.html",
+        kwargs={
+            "name": guest["first_name"],
+            "invite_code": guest["invite_code"],
+        },
+    )
+
+    print("Completed!!!")
+    return "success"
+
+
 worker.set_client_id("imports-worker")
 worker.register_task("imports", import_task_listener)
+worker.register_task("guest_invites", guest_invite_listener)
 
 
 def main():